@@ -2,15 +2,11 @@
 Lyrics Download and Translate - Modules
 """
 
+import importlib
+
+# Config is imported eagerly: the ``config`` submodule shares its name with the
+# instance, so a lazy lookup would be shadowed once the submodule is imported.
 from .config import config, Config
-from .proxy import proxy_handler, ProxyHandler
-from .translators import (
-    TranslationManager,
-    GoogleTranslator,
-    BaiduTranslator,
-    YoudaoTranslator
-)
-from .utils import is_section_marker
 
 __all__ = [
     'config',
@@ -23,3 +19,27 @@ __all__ = [
     'YoudaoTranslator',
     'is_section_marker'
 ]
+
+# Attribute name -> submodule, imported on first access (PEP 562)
+_LAZY = {
+    'proxy_handler': '.proxy',
+    'ProxyHandler': '.proxy',
+    'TranslationManager': '.translators',
+    'GoogleTranslator': '.translators',
+    'BaiduTranslator': '.translators',
+    'YoudaoTranslator': '.translators',
+    'is_section_marker': '.utils',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,228 @@
+"""
+Lyrics cache module.
+Memoizes successful lyrics lookups in memory and on disk for CACHE_TTL, and can remember
+confirmed misses for a shorter time so unfindable songs fail fast.
+"""
+
+import atexit
+import dataclasses
+import functools
+import os
+import re
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .sources.base import LyricsResult
+
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".lyrics-downloader", "lyrics_cache")
+MEMORY_SIZE = 1024
+# Lyrics rarely change, but corrections and re-scraped sources should show up
+CACHE_TTL = 30 * 24 * 60 * 60
+# Misses expire so songs that get added to a source later are found again
+NEGATIVE_TTL = 6 * 60 * 60
+
+# Unicode-aware so non-Latin titles don't all collapse to the same key
+_KEY_RE = re.compile(r'[\W_]+')
+# Shelf key prefix for misses; cache_key() output has exactly one "|", so no clash
+_MISS_PREFIX = "miss|"
+
+_lock = threading.Lock()
+# key -> (expiry timestamp, result)
+_memory: "OrderedDict[str, Tuple[float, LyricsResult]]" = OrderedDict()
+# key -> (expiry timestamp, error message)
+_misses: Dict[str, Tuple[float, str]] = {}
+_shelf = None
+
+
+def cache_key(artist: str, song: str) -> str:
+    """Build a normalized cache key so case and punctuation variants share entries."""
+    return f"{_KEY_RE.sub('', artist).casefold()}|{_KEY_RE.sub('', song).casefold()}"
+
+
+def _open_shelf():
+    """Open the on-disk cache once; return None if it is unusable."""
+    global _shelf
+    if _shelf is None:
+        try:
+            os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+            _shelf = shelve.open(CACHE_PATH)
+            atexit.register(_shelf.close)
+        except Exception:
+            _shelf = False
+    # An empty Shelf is falsy, so compare against the failure marker explicitly
+    return None if _shelf is False else _shelf
+
+
+def get(artist: str, song: str) -> Optional[LyricsResult]:
+    """Return an unexpired cached result for (artist, song), or None."""
+    key = cache_key(artist, song)
+    now = time.time()
+    with _lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            expires, result = entry
+            if expires > now:
+                _memory.move_to_end(key)
+                return dataclasses.replace(result)
+            del _memory[key]
+
+        shelf = _open_shelf()
+        if shelf is None:
+            return None
+        try:
+            data = shelf.get(key)
+        except Exception:
+            return None
+        if not data:
+            return None
+
+        try:
+            data = dict(data)
+            # Entries written before CACHE_TTL existed have no timestamp
+            expires = data.pop('expires', 0)
+            result = LyricsResult(**data)
+        except Exception:
+            result = None
+        if result is None or expires <= now:
+            # Stale, or written by an incompatible version: drop it and refetch
+            _discard(shelf, key)
+            return None
+
+        _remember(key, expires, result)
+        return dataclasses.replace(result)
+
+
+def get_miss(artist: str, song: str) -> Optional[LyricsResult]:
+    """Return the failed result recorded for (artist, song) if it has not expired."""
+    key = cache_key(artist, song)
+    now = time.time()
+    with _lock:
+        entry = _misses.get(key)
+        if entry is None:
+            shelf = _open_shelf()
+            if shelf is None:
+                return None
+            try:
+                data = shelf.get(_MISS_PREFIX + key)
+            except Exception:
+                return None
+            if not data:
+                return None
+            try:
+                entry = (data['expires'], data['error'])
+            except Exception:
+                _discard(shelf, _MISS_PREFIX + key)
+                return None
+            _misses[key] = entry
+
+        expires, error = entry
+        if expires <= now:
+            del _misses[key]
+            return None
+        return LyricsResult(success=False, error=error, not_found=True)
+
+
+def put_miss(artist: str, song: str, result: LyricsResult):
+    """
+    Record a confirmed miss for NEGATIVE_TTL seconds.
+
+    Only results with ``not_found`` set are recorded; a lookup that failed
+    because a source timed out or could not be reached is left alone.
+    """
+    if not result.not_found:
+        return
+
+    key = cache_key(artist, song)
+    entry = (time.time() + NEGATIVE_TTL, result.error or "Lyrics not found")
+    with _lock:
+        _misses[key] = entry
+        shelf = _open_shelf()
+        if shelf is not None:
+            try:
+                shelf[_MISS_PREFIX + key] = {'expires': entry[0], 'error': entry[1]}
+                shelf.sync()
+            except Exception:
+                pass
+
+
+def drop_miss(artist: str, song: str):
+    """Forget any recorded miss for (artist, song)."""
+    key = cache_key(artist, song)
+    with _lock:
+        _misses.pop(key, None)
+        shelf = _open_shelf()
+        if shelf is not None and _MISS_PREFIX + key in shelf:
+            _discard(shelf, _MISS_PREFIX + key)
+
+
+def put(artist: str, song: str, result: LyricsResult):
+    """Store a successful result; failures go through put_miss() instead."""
+    if not (result.success and result.lyrics):
+        return
+
+    key = cache_key(artist, song)
+    expires = time.time() + CACHE_TTL
+    with _lock:
+        _remember(key, expires, result)
+        shelf = _open_shelf()
+        if shelf is not None:
+            try:
+                shelf[key] = {**dataclasses.asdict(result), 'expires': expires}
+                shelf.sync()
+            except Exception:
+                pass
+
+
+def _discard(shelf, key: str):
+    """Remove a shelf entry, ignoring a cache file that cannot be written."""
+    try:
+        del shelf[key]
+        shelf.sync()
+    except Exception:
+        pass
+
+
+def _remember(key: str, expires: float, result: LyricsResult):
+    """Add to the in-memory LRU, evicting the oldest entry when full."""
+    _memory[key] = (expires, result)
+    _memory.move_to_end(key)
+    if len(_memory) > MEMORY_SIZE:
+        _memory.popitem(last=False)
+
+
+def lyrics_cache(func):
+    """
+    Cache decorator for ``fetch(self, artist, song, ...)``-style methods.
+
+    Lookups are skipped when the instance sets ``use_cache = False``, but the
+    fresh result is still stored, so a refresh replaces the stale entry and
+    clears any recorded miss. Misses are only remembered and replayed when it
+    sets ``cache_misses = True``, and then only those where every source
+    answered ``not_found``.
+    """
+    @functools.wraps(func)
+    def wrapper(self, artist: str, song: str, *args, **kwargs) -> LyricsResult:
+        cache_misses = getattr(self, 'cache_misses', False)
+        if getattr(self, 'use_cache', True):
+            cached = get(artist, song)
+            if cached is not None:
+                return cached
+
+            if cache_misses:
+                cached = get_miss(artist, song)
+                if cached is not None:
+                    return cached
+        else:
+            drop_miss(artist, song)
+
+        result = func(self, artist, song, *args, **kwargs)
+        if result.success and result.lyrics:
+            put(artist, song, result)
+        elif cache_misses and result.not_found:
+            put_miss(artist, song, result)
+        return result
+
+    return wrapper
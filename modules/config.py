@@ -4,39 +4,54 @@ Handles loading and accessing config.json settings.
 """
 
 import json
-from pathlib import Path
-from typing import Dict
+import os
+from functools import cache
+from typing import Dict, Optional, Tuple
+
+# Candidate config locations, in priority order
+_CANDIDATES = (
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"),
+    os.path.join(os.getcwd(), "config.json"),
+    os.path.join(os.path.expanduser("~"), ".lyrics-downloader", "config.json"),
+)
+
+
+def _mtime(path: str) -> Optional[int]:
+    """Modification time of ``path`` in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 class Config:
     """Configuration manager for lyrics downloader."""
 
-    _instance = None
-    _config = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._config = cls._load_config()
-        return cls._instance
-
-    @staticmethod
-    def _load_config() -> Dict:
-        """Load configuration from config.json."""
-        possible_paths = [
-            Path(__file__).parent.parent / "config.json",
-            Path.cwd() / "config.json",
-            Path.home() / ".lyrics-downloader" / "config.json",
-        ]
-
-        for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
-                except Exception:
-                    pass
+    def __init__(self):
+        self._config_path: Optional[str] = None
+        # (path, mtime_ns) of every candidate up to and including the one used
+        self._stamps: Tuple[Tuple[str, Optional[int]], ...] = ()
+        self._config = self._load_config()
 
+    def _load_config(self) -> Dict:
+        """Load configuration from config.json and remember which file was used."""
+        stamps = []
+        for path in _CANDIDATES:
+            try:
+                with open(path, 'rb') as f:
+                    mtime = os.fstat(f.fileno()).st_mtime_ns
+                    data = json.loads(f.read())
+            except Exception:
+                # Missing, unreadable or malformed - try the next candidate
+                stamps.append((path, _mtime(path)))
+                continue
+            stamps.append((path, mtime))
+            self._config_path = path
+            self._stamps = tuple(stamps)
+            return data
+
+        self._config_path = None
+        self._stamps = tuple(stamps)
         return {
             "proxy": {"enabled": False},
             "translation": {},
@@ -44,7 +59,14 @@ class Config:
         }
 
     def reload(self):
-        """Reload configuration from file."""
+        """
+        Reload configuration from file, skipping the parse if nothing changed.
+
+        The file in use and every higher-priority candidate are checked, so a
+        config.json created ahead of the current one is picked up.
+        """
+        if self._stamps and all(_mtime(path) == mtime for path, mtime in self._stamps):
+            return
         self._config = self._load_config()
 
     @property
@@ -63,4 +85,7 @@ class Config:
         return self._config.get(key, default)
 
 
+# Calling Config() always returns the one shared, lazily loaded instance
+Config = cache(Config)
+
 config = Config()
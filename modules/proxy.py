@@ -8,13 +8,100 @@ from typing import Optional, Dict
 
 from .config import config
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+# Keep-alive connections kept per host; also sizes the manager's fetch concurrency
+POOL_MAXSIZE = 20
+# Scraping retries: a throttled source is better skipped than waited on
+MAX_RETRIES = 2
+RETRY_BACKOFF_MAX = 5
+# Upper bound for a full-body read so a misbehaving server cannot exhaust memory
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+class PooledResponse:
+    """File-like view of a ``requests.Response`` matching ``urlopen()`` usage."""
+
+    def __init__(self, response):
+        self._response = response
+        self._chunks = None
+        self.status = response.status_code
+        self.headers = response.headers
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        if amt is None:
+            # Read in blocks so an oversized body fails before it is buffered
+            chunks = []
+            size = 0
+            for chunk in self._response.iter_content(65536):
+                size += len(chunk)
+                if size > MAX_BODY_BYTES:
+                    raise ValueError(f"Response body exceeds {MAX_BODY_BYTES} bytes")
+                chunks.append(chunk)
+            return b''.join(chunks)
+        # Partial read: pull from the stream so callers can stop early. The
+        # block size is fixed by the first call; iter_content never yields an
+        # empty block mid-stream, even while a compressed body is buffering
+        if self._chunks is None:
+            self._chunks = self._response.iter_content(amt)
+        return next(self._chunks, b'')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._response.close()
+
+
+def make_retry(methods=('GET',)):
+    """
+    Build the urllib3 retry policy for pooled sessions from config settings.
+
+    Only throttling and server errors are retried, at most MAX_RETRIES times
+    with backoff capped at RETRY_BACKOFF_MAX seconds. Retry-After is ignored so
+    a throttling site can't park a worker for minutes, and connection and read
+    failures are not retried, so an unreachable source still fails after a
+    single timeout.
+    """
+    settings = config.settings
+    attempts = min(settings.get("max_retries", 3), MAX_RETRIES)
+    options = dict(
+        total=attempts,
+        connect=0,
+        read=0,
+        status=attempts,
+        backoff_factor=settings.get("retry_delay", 2),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(methods),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_max=RETRY_BACKOFF_MAX, **options)
+    except TypeError:
+        # urllib3 < 2 has no backoff_max; with MAX_RETRIES attempts the first
+        # retry doesn't sleep there and the second waits one backoff_factor
+        return Retry(**options)
+
 
 class ProxyHandler:
     """Handles proxy configuration and request execution."""
 
     def __init__(self):
         self._opener: Optional[urllib.request.OpenerDirector] = None
+        self._proxies: Dict[str, str] = {}
+        self._session = None
         self._setup_proxy()
+        self._setup_session()
 
     def _setup_proxy(self):
         """Setup proxy opener from configuration."""
@@ -33,6 +120,7 @@ class ProxyHandler:
             proxies['https'] = https_proxy
 
         if proxies:
+            self._proxies = proxies
             proxy_handler = urllib.request.ProxyHandler(proxies)
             self._opener = urllib.request.build_opener(proxy_handler)
 
@@ -43,12 +131,32 @@ class ProxyHandler:
             if https_proxy:
                 print(f"  [Proxy] HTTPS: {https_proxy}")
 
+    def _setup_session(self):
+        """Create a shared keep-alive session when requests is installed."""
+        if requests is None:
+            return
+
+        self._session = requests.Session()
+        self._session.proxies.update(self._proxies)
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=make_retry())
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
     def open(self, url: str, headers: Optional[Dict] = None, timeout: int = 30):
         """Make HTTP request with proxy support."""
         if headers is None:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            headers = _DEFAULT_HEADERS
+
+        # Reuse pooled connections so repeated requests to a host skip the TLS handshake
+        if self._session is not None:
+            response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+            try:
+                response.raise_for_status()
+            except Exception:
+                # Streamed responses hold their connection until closed
+                response.close()
+                raise
+            return PooledResponse(response)
 
         req = urllib.request.Request(url, headers=headers)
 
@@ -61,6 +169,11 @@ class ProxyHandler:
     def is_enabled(self) -> bool:
         return self._opener is not None
 
+    @property
+    def session(self):
+        """Shared requests.Session, or None if requests is not installed."""
+        return self._session
+
 
 # Global proxy handler instance
 proxy_handler = ProxyHandler()
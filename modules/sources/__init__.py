@@ -2,13 +2,7 @@
 Lyrics sources module - Modular lyrics fetchers for different services.
 """
 
-from .base import BaseLyricsFetcher, LyricsResult
-from .genius import GeniusFetcher
-from .azlyrics import AZLyricsFetcher
-from .musixmatch import MusixmatchFetcher
-from .letras import LetrasFetcher
-from .youtube import YouTubeFetcher
-from .manager import LyricsSourceManager
+import importlib
 
 __all__ = [
     'BaseLyricsFetcher',
@@ -20,3 +14,28 @@ __all__ = [
     'YouTubeFetcher',
     'LyricsSourceManager',
 ]
+
+# Attribute name -> submodule, imported on first access (PEP 562)
+_LAZY = {
+    'BaseLyricsFetcher': '.base',
+    'LyricsResult': '.base',
+    'GeniusFetcher': '.genius',
+    'AZLyricsFetcher': '.azlyrics',
+    'MusixmatchFetcher': '.musixmatch',
+    'LetrasFetcher': '.letras',
+    'YouTubeFetcher': '.youtube',
+    'LyricsSourceManager': '.manager',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
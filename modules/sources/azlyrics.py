@@ -4,8 +4,28 @@ AZLyrics.com lyrics fetcher.
 
 import html
 import re
+from typing import Optional
 
-from .base import BaseLyricsFetcher, LyricsResult
+from .base import BaseLyricsFetcher, LyricsResult, is_not_found, read_until, slugify
+
+# The lyrics sit between the end of this comment and the next one
+_AZ_USAGE_MARKER = b'<!-- Usage of azlyrics.com content'
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _between_comments(html_content: bytes) -> Optional[bytes]:
+    """Return the bytes after the usage comment up to the next comment, if any."""
+    start = html_content.find(_AZ_USAGE_MARKER)
+    if start == -1:
+        return None
+    start = html_content.find(b'-->', start + len(_AZ_USAGE_MARKER))
+    if start == -1:
+        return None
+    start += len(b'-->')
+    end = html_content.find(b'<!--', start)
+    if end == -1:
+        return None
+    return html_content[start:end]
 
 
 class AZLyricsFetcher(BaseLyricsFetcher):
@@ -15,25 +35,26 @@ class AZLyricsFetcher(BaseLyricsFetcher):
     def priority(self) -> int:
         return 2
 
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """Search and extract lyrics from AZLyrics."""
         try:
             # Clean artist and song names for URL
-            artist_clean = re.sub(r'[^a-zA-Z0-9]', '', artist).lower()
-            song_clean = re.sub(r'[^a-zA-Z0-9]', '', song).lower()
+            # AZLyrics drops separators entirely
+            artist_clean = (artist_slug or slugify(artist, '-')).replace('-', '')
+            song_clean = (song_slug or slugify(song, '-')).replace('-', '')
             url = f"https://www.azlyrics.com/lyrics/{artist_clean}/{song_clean}.html"
 
             with self._make_request(url, timeout=30) as response:
-                html_content = response.read().decode('utf-8')
+                # Stop downloading once the lyrics block has closed
+                html_content = read_until(response, _AZ_USAGE_MARKER, b'-->', b'<!--')
 
-                # Extract lyrics from comment
-                match = re.search(
-                    r'<!-- Usage of azlyrics\.com content.*?-->(.*?)<!--',
-                    html_content, re.DOTALL
-                )
+                # Slice the raw bytes between the delimiters; only the lyrics are decoded
+                lyrics_html = _between_comments(html_content)
 
-                if match:
-                    lyrics = self._clean_lyrics(match.group(1))
+                if lyrics_html is not None:
+                    lyrics = self._clean_lyrics(lyrics_html.decode('utf-8', errors='replace'))
                     if lyrics:
                         return LyricsResult(
                             success=True,
@@ -44,7 +65,7 @@ class AZLyricsFetcher(BaseLyricsFetcher):
                         )
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
         return LyricsResult(success=False, error="Lyrics not found")
 
@@ -57,9 +78,9 @@ class AZLyricsFetcher(BaseLyricsFetcher):
         text = html.unescape(content)
 
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
 
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = ' '.join(text.split())
 
         return text
@@ -2,9 +2,185 @@
 Base classes for lyrics fetchers.
 """
 
+import functools
+import html
+import queue
+import re
+import string
+import threading
+import urllib.request
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional, Sequence, TypeVar
+
+from ..proxy import proxy_handler
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Shared, read-only request headers. No Accept-Encoding: the pooled session
+# adds gzip/deflate and decodes transparently, while urllib gets plain bodies
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Connection': 'keep-alive',
+}
+
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+_SLUG_RE = re.compile(r'[^a-zA-Z0-9]')
+# Linear-time when google-re2 is installed; the pattern is regular either way
+_TAG_RE = (re2 or re).compile(r'<[^>]+>')
+_CRLF_RE = re.compile(r'\r\n?')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+_DIV_TAG_RE = re.compile(rb'<(/?)div\b')
+# str.translate tables for the common separators; ASCII-only input skips the regex
+_SLUG_TABLES = {
+    sep: str.maketrans({
+        c: sep for c in map(chr, range(128))
+        if c not in string.ascii_letters and c not in string.digits
+    })
+    for sep in ('', '-')
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def slugify(text: str, sep: str = '') -> str:
+    """
+    Build a URL slug from an artist or song name.
+
+    Non-alphanumeric characters are replaced with ``sep`` (dropped by default)
+    and the result is lowercased with leading/trailing separators removed.
+    Cached because every source slugs the same names for each lookup.
+
+    Args:
+        text: Artist or song name
+        sep: Replacement for non-alphanumeric characters
+
+    Returns:
+        Lowercase slug
+    """
+    table = _SLUG_TABLES.get(sep)
+    if table is not None and text.isascii():
+        return text.translate(table).lower().strip(sep)
+    return _SLUG_RE.sub(sep, text).lower().strip(sep)
+
+
+def find_closing_div(html_content: bytes, pos: int) -> int:
+    """
+    Locate the ``</div>`` that closes an element, honouring nested divs.
+
+    A non-greedy ``<div ...>(.*?)</div>`` regex stops at the first inner
+    ``</div>``; counting opening and closing tags keeps the whole element.
+
+    Args:
+        html_content: Raw page bytes
+        pos: Index just past the element's opening tag
+
+    Returns:
+        Index of the matching closing tag, or -1 if the element never closes
+    """
+    depth = 1
+    for match in _DIV_TAG_RE.finditer(html_content, pos):
+        depth += -1 if match.group(1) else 1
+        if depth == 0:
+            return match.start()
+    return -1
+
+
+def read_until(response, *markers: bytes, chunk_size: int = 16384) -> bytes:
+    """
+    Read a response body only as far as it is needed.
+
+    Reads ``chunk_size`` blocks until each of ``markers`` has been seen, in
+    order, then stops; the rest of the page is never downloaded or decoded.
+    If a marker never appears the whole body is returned.
+
+    Args:
+        response: Object returned by ``_make_request``
+        markers: Byte strings to find one after another
+        chunk_size: Bytes requested per read
+
+    Returns:
+        The body read so far, ending at or shortly after the last marker
+    """
+    buffer = bytearray()
+    pending = list(markers)
+    pos = 0
+    while pending:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            break
+        buffer += chunk
+
+        while pending:
+            marker = pending[0]
+            found = buffer.find(marker, pos)
+            if found == -1:
+                # Keep enough overlap for a marker split across chunks
+                pos = max(pos, len(buffer) - len(marker) + 1)
+                break
+            pos = found + len(marker)
+            pending.pop(0)
+
+    return bytes(buffer)
+
+
+def is_not_found(exc: Exception) -> bool:
+    """Whether ``exc`` is a server's 404 reply rather than a failure to reach it."""
+    response = getattr(exc, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(exc, 'code', None)
+    return status == 404
+
+
+def first_in_order(func: Callable[[_T], _R], items: Sequence[_T],
+                   accept: Callable[[_R], bool]) -> Optional[_R]:
+    """
+    Run ``func`` on every item concurrently and return the earliest accepted result.
+
+    Results are considered in ``items`` order, so a later item only wins once
+    every earlier one has finished without an accepted result. Work runs on
+    daemon threads that are simply abandoned after the answer is known, so a
+    slow request never holds up the caller or interpreter exit.
+
+    Args:
+        func: Called once per item; raising counts as not accepted
+        items: Inputs in priority order
+        accept: Whether a result is good enough to return
+
+    Returns:
+        The first accepted result in priority order, or None
+    """
+    results = queue.SimpleQueue()
+
+    def run(index, item):
+        try:
+            value = func(item)
+        except Exception:
+            value = None
+        results.put((index, value))
+
+    for index, item in enumerate(items):
+        threading.Thread(target=run, args=(index, item), daemon=True).start()
+
+    finished = {}
+    next_index = 0
+    while next_index < len(items):
+        index, value = results.get()
+        finished[index] = value
+        # Walk forward through items that are done, in priority order
+        while next_index in finished:
+            value = finished.pop(next_index)
+            if value is not None and accept(value):
+                return value
+            next_index += 1
+
+    return None
 
 
 @dataclass
@@ -16,6 +192,8 @@ class LyricsResult:
     lyrics: Optional[str] = None
     source: Optional[str] = None
     error: Optional[str] = None
+    # The source answered and has no lyrics, as opposed to failing to answer
+    not_found: bool = False
 
 
 class BaseLyricsFetcher(ABC):
@@ -38,13 +216,17 @@ class BaseLyricsFetcher(ABC):
         pass
 
     @abstractmethod
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """
         Fetch lyrics for the given artist and song.
 
         Args:
             artist: The artist name
             song: The song title
+            artist_slug: Precomputed ``slugify(artist, '-')``, if available
+            song_slug: Precomputed ``slugify(song, '-')``, if available
 
         Returns:
             LyricsResult with success status and lyrics if found
@@ -55,6 +237,10 @@ class BaseLyricsFetcher(ABC):
         """
         Make HTTP request with proxy support.
 
+        Uses the shared keep-alive session when requests is installed and the
+        fetcher runs with the configured proxy (or none); otherwise falls back
+        to urllib.
+
         Args:
             url: URL to request
             headers: Optional headers dictionary
@@ -63,16 +249,11 @@ class BaseLyricsFetcher(ABC):
         Returns:
             Response object
         """
-        import urllib.request
-
         if headers is None:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'identity',
-                'Connection': 'keep-alive',
-            }
+            headers = _DEFAULT_HEADERS
+
+        if proxy_handler.session is not None and self._proxy_opener in (None, proxy_handler._opener):
+            return proxy_handler.open(url, headers=headers, timeout=timeout)
 
         req = urllib.request.Request(url, headers=headers)
 
@@ -80,3 +261,37 @@ class BaseLyricsFetcher(ABC):
             return self._proxy_opener.open(req, timeout=timeout)
         else:
             return urllib.request.urlopen(req, timeout=timeout)
+
+    def _clean_lyrics(self, content: str) -> str:
+        """
+        Clean lyrics content.
+
+        Decodes entities, drops tags and normalizes whitespace. Sources with
+        site-specific markup override this.
+        """
+        if not content:
+            return ""
+
+        # Decode HTML entities
+        text = html.unescape(content)
+
+        # Each pass below copies the whole text, so skip the ones a cheap
+        # substring check shows have nothing to do
+
+        # Remove HTML tags
+        if '<' in text:
+            text = _TAG_RE.sub('', text)
+
+        # Normalize line endings
+        if '\r' in text:
+            text = _CRLF_RE.sub('\n', text)
+
+        # Remove excessive blank lines
+        if '\n\n\n' in text:
+            text = _MULTI_NEWLINE_RE.sub('\n\n', text)
+
+        # Strip each line
+        lines = [line.strip() for line in text.split('\n')]
+        text = '\n'.join(lines)
+
+        return text.strip()
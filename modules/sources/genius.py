@@ -2,10 +2,110 @@
 Genius.com lyrics fetcher.
 """
 
-import json
-import re
 import html
-from .base import BaseLyricsFetcher, LyricsResult
+import re
+import urllib.parse
+from typing import List, Optional
+
+from .base import BaseLyricsFetcher, LyricsResult, find_closing_div, is_not_found
+from ..utils import json_loads
+
+_SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://genius.com/',
+    'X-Requested-With': 'XMLHttpRequest'
+}
+
+# Page patterns run on the raw response bytes; only matched slices are decoded
+_TITLE_PREFIX = b'<meta property="og:title" content="'
+_JSONLD_RE = re.compile(rb'<script type="application/ld\+json">([^<]+)</script>')
+# Opening tags only, matched at candidates found by marker; the bodies are cut
+# out with find_closing_div so nested divs inside a container don't truncate it
+_DATA_CONTAINER_RE = re.compile(rb'<div[^>]*data-lyrics-container="true"[^>]*>')
+_CLASS_CONTAINER_RE = re.compile(rb'<div[^>]*class="[^"]*Lyrics__Container[^"]*"[^>]*>')
+# Headers and annotations Genius nests in containers but keeps out of the lyrics
+_EXCLUDED_RE = re.compile(rb'<div[^>]*data-exclude-from-selection="true"[^>]*>')
+_BR_RE = re.compile(r'\s*<br\s*/?>\s*', re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r'\s*</p>\s*', re.IGNORECASE)
+_DIV_OPEN_RE = re.compile(r'\s*<div[^>]*>\s*', re.IGNORECASE)
+_DIV_CLOSE_RE = re.compile(r'\s*</div>\s*', re.IGNORECASE)
+# A run of line-break markup and the whitespace around it
+_BREAK_RUN_RE = re.compile(r'\s*(?:(?:<br\s*/?>|</p>|<div[^>]*>|</div>)\s*)+', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_METADATA_RE = re.compile(r'^\d+\s*Contributor|Lyrics\s*$')
+_MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
+
+
+def _meta_title(html_content: bytes) -> Optional[str]:
+    """Return the og:title content, sliced out with find() instead of a regex."""
+    start = html_content.find(_TITLE_PREFIX)
+    if start == -1:
+        return None
+    start += len(_TITLE_PREFIX)
+    end = html_content.find(b'"', start)
+    if end <= start:
+        return None
+    return html_content[start:end].decode('utf-8', errors='replace')
+
+
+def _break_run(match: re.Match) -> str:
+    """
+    Replacement for _BREAK_RUN_RE: turn one run of break markup into newlines.
+
+    A lone ``<br>`` is by far the most common run and maps to one newline.
+    Anything else replays the br, p, div-open, div-close passes on just that
+    run: each pass eats the whitespace (and newlines) the earlier ones left,
+    which decides between a line and a paragraph break.
+    """
+    run = match.group(0)
+    if _BR_RE.fullmatch(run):
+        return '\n'
+    run = _BR_RE.sub('\n', run)
+    run = _P_CLOSE_RE.sub('\n\n', run)
+    run = _DIV_OPEN_RE.sub('\n', run)
+    return _DIV_CLOSE_RE.sub('\n', run)
+
+
+def _container_bodies(html_content: bytes, marker: bytes, opening_re) -> List[bytes]:
+    """
+    Return the inner HTML of every container whose opening tag holds ``marker``.
+
+    Walks the page with ``bytes.find`` on the literal marker and only runs
+    ``opening_re`` on the candidate tag, so the page between and after the
+    containers is never regex-scanned.
+    """
+    bodies = []
+    pos = 0
+    while True:
+        index = html_content.find(marker, pos)
+        if index == -1:
+            break
+        tag_start = html_content.rfind(b'<div', 0, index)
+        match = opening_re.match(html_content, tag_start) if tag_start != -1 else None
+        if match is None or match.end() <= index:
+            # Marker outside a container's opening tag (script, text, ...)
+            pos = index + len(marker)
+            continue
+        end = find_closing_div(html_content, match.end())
+        if end == -1:
+            break
+        bodies.append(_drop_excluded(html_content[match.end():end]))
+        pos = end
+    return bodies
+
+
+def _drop_excluded(body: bytes) -> bytes:
+    """Cut ``data-exclude-from-selection`` blocks out of a container body."""
+    match = _EXCLUDED_RE.search(body)
+    while match:
+        end = find_closing_div(body, match.end())
+        if end == -1:
+            break
+        body = body[:match.start()] + body[end + len(b'</div>'):]
+        match = _EXCLUDED_RE.search(body, match.start())
+    return body
 
 
 class GeniusFetcher(BaseLyricsFetcher):
@@ -15,25 +115,17 @@ class GeniusFetcher(BaseLyricsFetcher):
     def priority(self) -> int:
         return 1
 
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """Search and extract lyrics from Genius."""
-        import urllib.request
-        import urllib.parse
-
         query = f"{artist} {song}"
         search_url = f"https://genius.com/api/search/multi?q={urllib.parse.quote(query)}"
 
         try:
             # Search for song with proper headers for Genius API
-            search_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/plain, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://genius.com/',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-            with self._make_request(search_url, headers=search_headers, timeout=30) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            with self._make_request(search_url, headers=_SEARCH_HEADERS, timeout=30) as response:
+                data = json_loads(response.read())
 
                 song_url = self._find_song_url(data)
 
@@ -41,9 +133,10 @@ class GeniusFetcher(BaseLyricsFetcher):
                     return self._extract_lyrics(song_url)
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
-        return LyricsResult(success=False, error="Song not found")
+        # The search answered with no matching song
+        return LyricsResult(success=False, error="Song not found", not_found=True)
 
     def _find_song_url(self, data: dict) -> str:
         """Find song URL from search results."""
@@ -67,13 +160,10 @@ class GeniusFetcher(BaseLyricsFetcher):
         """Extract lyrics from Genius page."""
         try:
             with self._make_request(url, timeout=30) as response:
-                html_content = response.read().decode('utf-8')
+                html_content = response.read()
 
                 # Extract title
-                title_match = re.search(
-                    r'<meta property="og:title" content="([^"]+)"', html_content
-                )
-                song_title = title_match.group(1) if title_match else "Unknown"
+                song_title = _meta_title(html_content) or "Unknown"
 
                 # Extract lyrics using multiple methods
                 lyrics = self._extract_lyrics_from_html(html_content)
@@ -89,43 +179,37 @@ class GeniusFetcher(BaseLyricsFetcher):
                     )
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
         return LyricsResult(success=False, error="Failed to extract lyrics")
 
-    def _extract_lyrics_from_html(self, html_content: str) -> str:
-        """Extract lyrics from HTML content using multiple strategies."""
+    def _extract_lyrics_from_html(self, html_content: bytes) -> str:
+        """Extract lyrics from raw page bytes using multiple strategies."""
         lyrics = None
 
-        # Method 1: JSON-LD
-        json_ld = re.search(
-            r'<script type="application/ld\+json">([^<]+)</script>', html_content
-        )
-        if json_ld:
-            try:
-                data = json.loads(json_ld.group(1))
-                lyrics = data.get('recordingOf', {}).get('lyrics', {}).get('text')
-            except:
-                pass
-
-        # Method 2: data-lyrics-container
+        # Method 1: data-lyrics-container, the markup current Genius pages use;
+        # the other methods only run when it is missing
+        containers = _container_bodies(html_content, b'data-lyrics-container="true"', _DATA_CONTAINER_RE)
+        if containers:
+            lyrics_html = b'\n\n'.join(containers).decode('utf-8', errors='replace')
+            lyrics = self._clean_html(lyrics_html)
+
+        # Method 2: JSON-LD
         if not lyrics:
-            containers = re.findall(
-                r'<div[^>]*data-lyrics-container="true"[^>]*>(.*?)</div>',
-                html_content, re.DOTALL
-            )
-            if containers:
-                lyrics_html = '\n\n'.join(containers)
-                lyrics = self._clean_html(lyrics_html)
+            start = html_content.find(b'<script type="application/ld+json">')
+            json_ld = _JSONLD_RE.search(html_content, start) if start != -1 else None
+            if json_ld:
+                try:
+                    data = json_loads(json_ld.group(1))
+                    lyrics = data.get('recordingOf', {}).get('lyrics', {}).get('text')
+                except:
+                    pass
 
         # Method 3: Lyrics__Container
         if not lyrics:
-            containers = re.findall(
-                r'<div[^>]*class="[^"]*Lyrics__Container[^"]*"[^>]*>(.*?)</div>',
-                html_content, re.DOTALL
-            )
+            containers = _container_bodies(html_content, b'Lyrics__Container', _CLASS_CONTAINER_RE)
             if containers:
-                lyrics_html = '\n\n'.join(containers)
+                lyrics_html = b'\n\n'.join(containers).decode('utf-8', errors='replace')
                 lyrics = self._clean_html(lyrics_html)
 
         return lyrics
@@ -136,18 +220,15 @@ class GeniusFetcher(BaseLyricsFetcher):
             return ""
 
         text = html_content
-        
-        # Preserve line breaks from HTML
-        text = re.sub(r'\s*<br\s*/?>\s*', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*</p>\s*', '\n\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*<div[^>]*>\s*', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*</div>\s*', '\n', text, flags=re.IGNORECASE)
-        
+
+        # Preserve line breaks from HTML, in one scan over the markup
+        text = _BREAK_RUN_RE.sub(_break_run, text)
+
         # Decode HTML entities
         text = html.unescape(text)
 
         # Remove remaining HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
 
         return text.strip()
     
@@ -157,29 +238,9 @@ class GeniusFetcher(BaseLyricsFetcher):
             return ""
         
         # Remove UI elements
-        text = re.sub(r'^\d+\s*Contributor', '', text)
-        text = re.sub(r'Lyrics\s*$', '', text)
-        
-        # Normalize whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-        prev_empty = False
-        
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                if not prev_empty:
-                    cleaned_lines.append('')
-                    prev_empty = True
-                continue
-            
-            prev_empty = False
-            cleaned_lines.append(stripped)
-        
-        # Remove leading/trailing empty lines
-        while cleaned_lines and not cleaned_lines[0]:
-            cleaned_lines.pop(0)
-        while cleaned_lines and not cleaned_lines[-1]:
-            cleaned_lines.pop()
-        
-        return '\n'.join(cleaned_lines)
\ No newline at end of file
+        text = _METADATA_RE.sub('', text)
+
+        # Strip every line, then collapse runs of blank lines to one; a
+        # split/strip/join is several times faster than a line-edge regex
+        text = '\n'.join([line.strip() for line in text.split('\n')])
+        return _MULTI_NEWLINE_RE.sub('\n\n', text).strip()
\ No newline at end of file
@@ -2,9 +2,45 @@
 Letras.com lyrics fetcher.
 """
 
-import re
 import html
-from .base import BaseLyricsFetcher, LyricsResult
+import re
+from typing import Optional
+
+from .base import BaseLyricsFetcher, LyricsResult, is_not_found, slugify
+
+# One scan finds divs whose class or id mentions lyrics; the opening tag is
+# captured so each hit can be attributed to the attribute(s) that matched
+_LYRICS_DIV_RE = re.compile(
+    r'(<div[^>]*(?:class|id)="[^"]*lyrics[^"]*"[^>]*>)(.*?)</div>', re.DOTALL | re.IGNORECASE
+)
+_LYRICS_ATTR_RES = tuple(
+    re.compile(rf'{attr}="[^"]*lyrics[^"]*"', re.IGNORECASE) for attr in ("class", "id")
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BR_RE = re.compile(r'\s*<br\s*/?\>\s*', re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r'\s*</p>\s*', re.IGNORECASE)
+_METADATA_RE = re.compile(
+    r'^(lyrics views[\d\s\.]*|Numb|Linkin Park|Lyrics|Meaning|Translations)*\s*',
+    re.IGNORECASE
+)
+# Credit and trailing-metadata lines
+_SKIP_LINE_RE = re.compile(
+    r"^(?:Written by:|Subtitled by|Revised by|Did you see an error|Isn't this right)"
+    r"|Bourdon / Brad Delson",
+    re.IGNORECASE
+)
+_PAREN_OPEN_RE = re.compile(r'\s*\(\s*')
+_PAREN_CLOSE_RE = re.compile(r'\s*\)\s*')
+_INLINE_MARKER_RE = re.compile(r"(\S)(\[.+?\])")
+_CRLF_RE = re.compile(r"\r\n?")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+_UI_INDICATORS = (
+    "Add to favorites", "Add to Playlist", "Font size",
+    "Tab", "Print", "Correct", "Auto-scroll", "Notes",
+    "Restore", "Apply", "Send us", "revision"
+)
+# No indicator overlaps another, so one scan finds every distinct indicator
+_UI_INDICATOR_RE = re.compile("|".join(map(re.escape, _UI_INDICATORS)))
 
 
 class LetrasFetcher(BaseLyricsFetcher):
@@ -14,12 +50,14 @@ class LetrasFetcher(BaseLyricsFetcher):
     def priority(self) -> int:
         return 4
 
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """Search and extract lyrics from Letras."""
         try:
             # Clean artist and song names for URL
-            artist_clean = re.sub(r"[^a-zA-Z0-9]", "-", artist).lower().strip("-")
-            song_clean = re.sub(r"[^a-zA-Z0-9]", "-", song).lower().strip("-")
+            artist_clean = artist_slug or slugify(artist, "-")
+            song_clean = song_slug or slugify(song, "-")
             url = f"https://www.letras.com/{artist_clean}/{song_clean}/"
 
             with self._make_request(url, timeout=30) as response:
@@ -40,47 +78,61 @@ class LetrasFetcher(BaseLyricsFetcher):
                         )
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
         return LyricsResult(success=False, error="Lyrics not found")
 
     def _extract_lyrics(self, html_content: str) -> str:
         """Extract lyrics from HTML."""
-        # Try div with lyrics class or id first
-        for attr in ["class", "id"]:
-            pattern = rf'<div[^>]*{attr}="[^"]*lyrics[^"]*"[^>]*>(.*?)</div>'
-            match = re.search(pattern, html_content, re.DOTALL | re.IGNORECASE)
-            if match:
-                content = match.group(1)
-                if self._is_valid_lyrics(content):
-                    return content
+        # Try div with lyrics class or id first: the first div of each kind,
+        # class before id, found in a single pass over the page
+        candidates = [None] * len(_LYRICS_ATTR_RES)
+        pos = 0
+        while None in candidates:
+            match = _LYRICS_DIV_RE.search(html_content, pos)
+            if not match:
+                break
+            tag = match.group(1)
+            for kind, attr_re in enumerate(_LYRICS_ATTR_RES):
+                if candidates[kind] is None and attr_re.search(tag):
+                    candidates[kind] = match.group(2)
+            # Resume inside the match: lyrics divs are often nested
+            pos = match.start() + 1
+
+        for content in candidates:
+            if content is not None and self._is_valid_lyrics(content):
+                return content
         
-        # Fallback to article tag
-        match = re.search(r"<article[^>]*>(.*?)</article>", html_content, re.DOTALL)
-        if match:
-            return match.group(1)
+        # Fallback to article tag; plain slicing is enough, tags are
+        # stripped later by _clean_lyrics
+        start = html_content.find("<article")
+        if start != -1:
+            body_start = html_content.find(">", start) + 1
+            end = html_content.find("</article>", body_start) if body_start else -1
+            if end != -1:
+                return html_content[body_start:end]
         
         return ""
 
     def _is_valid_lyrics(self, content: str) -> bool:
         """Check if content looks like actual lyrics."""
-        if not content:
+        # Stripping tags and entities never lengthens the text, so short
+        # blocks can be rejected before parsing them
+        if len(content) < 50:
             return False
         
-        text = re.sub(r"<[^>]+>", "", content)
+        text = _TAG_RE.sub("", content)
         text = html.unescape(text)
         
         if len(text) < 50:
             return False
         
-        ui_indicators = [
-            "Add to favorites", "Add to Playlist", "Font size", 
-            "Tab", "Print", "Correct", "Auto-scroll", "Notes",
-            "Restore", "Apply", "Send us", "revision"
-        ]
-        
-        ui_count = sum(1 for indicator in ui_indicators if indicator in text)
-        return ui_count <= 3
+        found = set()
+        for match in _UI_INDICATOR_RE.finditer(text):
+            found.add(match.group())
+            if len(found) > 3:
+                return False
+        return True
 
     def _clean_lyrics(self, content: str) -> str:
         """Clean lyrics content and remove UI elements."""
@@ -89,75 +141,37 @@ class LetrasFetcher(BaseLyricsFetcher):
 
         text = html.unescape(content)
         # Preserve line breaks from HTML
-        text = re.sub(r'\s*<br\s*/?\>\s*', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'\s*</p>\s*', '\n\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Fix case where metadata and first line are concatenated
-        # Pattern: metadata words followed by actual lyric line
-        # Remove common metadata patterns from start of lines
-        metadata_pattern = r'^(lyrics views[\d\s\.]*|Numb|Linkin Park|Lyrics|Meaning|Translations)*\s*'
-        lines = text.split('\n')
-        cleaned = []
-        for line in lines:
-            # Remove leading metadata words
-            clean_line = re.sub(metadata_pattern, '', line, flags=re.IGNORECASE).strip()
-            # Keep empty lines (paragraph breaks)
-            if clean_line or line.strip() == '':
-                cleaned.append(clean_line)
-        text = '\n'.join(cleaned)
-        
-        # Remove credits and trailing metadata
-        skip_line_patterns = [
-            r'^Written by:',
-            r'^Subtitled by',
-            r'^Revised by',
-            r'^Did you see an error',
-            r"^Isn't this right",
-            r'Bourdon / Brad Delson',
-        ]
+        text = _BR_RE.sub('\n', text)
+        text = _P_CLOSE_RE.sub('\n\n', text)
+        text = _TAG_RE.sub('', text)
         
-        lines = text.split('\n')
+        # Fix case where metadata and first line are concatenated, and drop
+        # credit lines, in a single pass over the lines
         cleaned_lines = []
-        for line in lines:
-            stripped = line.strip()
-            # Keep empty lines (paragraph breaks)
-            if not stripped:
-                cleaned_lines.append('')
+        for line in text.split('\n'):
+            # Remove leading metadata words
+            clean_line = _METADATA_RE.sub('', line, count=1).strip()
+            if not clean_line:
+                # Keep empty lines (paragraph breaks), drop metadata-only lines
+                if not line.strip():
+                    cleaned_lines.append('')
                 continue
             # Skip credit lines
-            if any(re.search(pattern, stripped, re.IGNORECASE) for pattern in skip_line_patterns):
+            if _SKIP_LINE_RE.search(clean_line):
                 continue
-            cleaned_lines.append(stripped)
-        
+            cleaned_lines.append(clean_line)
+
         text = '\n'.join(cleaned_lines)
         
         # Fix formatting - ensure parentheses are on their own lines
-        text = re.sub(r'\s*\(\s*', '\n(', text)
-        text = re.sub(r'\s*\)\s*', ')\n', text)
-        text = re.sub(r"(\S)(\[.+?\])", r"\1\n\2", text)
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-        
-        # Clean up lines but preserve paragraph breaks (double newlines = paragraph separator)
-        lines = text.split("\n")
-        cleaned_lines = []
-        prev_empty = False
+        text = _PAREN_OPEN_RE.sub('\n(', text)
+        text = _PAREN_CLOSE_RE.sub(')\n', text)
+        text = _INLINE_MARKER_RE.sub(r"\1\n\2", text)
+        text = _CRLF_RE.sub("\n", text)
         
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                # Mark paragraph break with empty line
-                if not prev_empty:
-                    cleaned_lines.append("")
-                    prev_empty = True
-                continue
-            prev_empty = False
-            cleaned_lines.append(stripped)
-        
-        # Remove leading/trailing empty lines
-        while cleaned_lines and not cleaned_lines[0]:
-            cleaned_lines.pop(0)
-        while cleaned_lines and not cleaned_lines[-1]:
-            cleaned_lines.pop()
-        
-        return "\n".join(cleaned_lines)
\ No newline at end of file
+        # Strip every line and collapse blank runs to a single paragraph break;
+        # split/strip/join is several times faster than a line-edge regex
+        text = "\n".join([line.strip() for line in text.split("\n")])
+        text = _MULTI_NEWLINE_RE.sub("\n\n", text)
+
+        return text.strip()
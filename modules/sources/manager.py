@@ -2,73 +2,164 @@
 Lyrics source manager - coordinates multiple lyrics fetchers.
 """
 
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import Iterable, List, Tuple
 
-from .base import BaseLyricsFetcher, LyricsResult
+from ..cache import lyrics_cache
+from ..proxy import POOL_MAXSIZE
+from .base import BaseLyricsFetcher, LyricsResult, first_in_order, slugify
+
+# Fetches in flight across every song and manager. A YouTube fetch can hold up
+# to three connections (its video probes), so this keeps the total within the
+# shared session's connection pool
+MAX_CONCURRENT_FETCHES = POOL_MAXSIZE // 3
+_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+
+
+def _has_lyrics(result: LyricsResult) -> bool:
+    return result.success and bool(result.lyrics)
+
+
+@cache
+def _fetcher_classes() -> Tuple[type, ...]:
+    """Fetcher classes in priority order (lower = try first), imported once."""
+    from .genius import GeniusFetcher
+    from .azlyrics import AZLyricsFetcher
+    from .musixmatch import MusixmatchFetcher
+    from .letras import LetrasFetcher
+    from .youtube import YouTubeFetcher
+
+    return (
+        GeniusFetcher,
+        AZLyricsFetcher,
+        MusixmatchFetcher,
+        LetrasFetcher,
+        YouTubeFetcher,
+    )
 
 
 class LyricsSourceManager:
     """Manages multiple lyrics fetchers with priority-based fallback."""
 
-    def __init__(self, proxy_opener=None):
+    def __init__(self, proxy_opener=None, use_cache: bool = True,
+                 cache_misses: bool = False):
         """
         Initialize manager with fetcher instances.
 
         Args:
             proxy_opener: Optional proxy opener for HTTP requests
+            use_cache: Reuse previously fetched lyrics (memory and disk)
+            cache_misses: Also remember songs every source reported missing,
+                for a few hours
         """
+        self.use_cache = use_cache
+        self.cache_misses = cache_misses
         self._fetchers: List[BaseLyricsFetcher] = []
         self._init_fetchers(proxy_opener)
 
     def _init_fetchers(self, proxy_opener):
         """Initialize all available fetchers."""
-        from .genius import GeniusFetcher
-        from .azlyrics import AZLyricsFetcher
-        from .musixmatch import MusixmatchFetcher
-        from .letras import LetrasFetcher
-        from .youtube import YouTubeFetcher
-
-        self._fetchers = [
-            GeniusFetcher(proxy_opener),
-            AZLyricsFetcher(proxy_opener),
-            MusixmatchFetcher(proxy_opener),
-            LetrasFetcher(proxy_opener),
-            YouTubeFetcher(proxy_opener),
-        ]
-
-        # Sort by priority (lower = try first)
-        self._fetchers.sort(key=lambda f: f.priority)
+        self._fetchers = [cls(proxy_opener) for cls in _fetcher_classes()]
 
     @property
     def sources(self) -> List[str]:
         """Return list of available source names."""
         return [f.name for f in self._fetchers]
 
-    def fetch_lyrics(self, artist: str, song: str) -> LyricsResult:
+    @lyrics_cache
+    def fetch_lyrics(self, artist: str, song: str, verbose: bool = True) -> LyricsResult:
         """
-        Try all sources in priority order until lyrics are found.
+        Fetch lyrics, trying the preferred source first and fanning out on a miss.
+
+        The top-priority source answers most lookups on its own, so it is
+        queried alone. Only when it has nothing are the remaining sources
+        queried concurrently; a success is returned once every
+        higher-priority fallback has finished without lyrics, and fallbacks
+        still in flight are abandoned instead of waited for. Successful
+        results are cached by normalized (artist, song).
 
         Args:
             artist: The artist name
             song: The song title
+            verbose: Print progress for each source
 
         Returns:
             LyricsResult with lyrics if found, or error status
         """
-        for fetcher in self._fetchers:
-            print(f"  Trying {fetcher.name}...")
-
-            result = fetcher.fetch(artist, song)
-
-            if result.success and result.lyrics:
-                print(f"  [OK] Found lyrics on {fetcher.name}!")
-                return result
-
+        # Slug once here instead of once per URL-based source
+        artist_slug = slugify(artist, '-')
+        song_slug = slugify(song, '-')
+
+        # Every answer that came back, to tell "nobody has it" from "some failed"
+        answers = []
+
+        def fetch(fetcher: BaseLyricsFetcher) -> LyricsResult:
+            with _FETCH_SLOTS:
+                result = fetcher.fetch(artist, song, artist_slug, song_slug)
+            answers.append(result)
+            return result
+
+        preferred, *fallbacks = self._fetchers
+
+        if verbose:
+            print(f"  Trying {preferred.name}...")
+        try:
+            result = fetch(preferred)
+        except Exception:
+            result = None
+
+        if result is None or not _has_lyrics(result):
+            if verbose:
+                for fetcher in fallbacks:
+                    print(f"  Trying {fetcher.name}...")
+            result = first_in_order(fetch, fallbacks, _has_lyrics)
+
+        if result is not None and _has_lyrics(result):
+            if verbose:
+                print(f"  [OK] Found lyrics on {result.source}!")
+            return result
+
+        # Only a miss every source confirmed may be remembered by the cache
         return LyricsResult(
             success=False,
-            error="Could not find lyrics from any source"
+            error="Could not find lyrics from any source",
+            not_found=(len(answers) == len(self._fetchers)
+                       and all(answer.not_found for answer in answers))
         )
 
+    def fetch_many(self, songs: Iterable[Tuple[str, str]],
+                   max_workers: int = 8) -> List[LyricsResult]:
+        """
+        Fetch lyrics for many songs concurrently.
+
+        Args:
+            songs: Iterable of (artist, song) pairs
+            max_workers: Number of songs looked up at the same time; source
+                requests across all of them stay capped at MAX_CONCURRENT_FETCHES
+
+        Returns:
+            List of LyricsResult in the same order as ``songs``
+        """
+        songs = list(songs)
+        if not songs:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(songs))) as executor:
+            futures = [
+                executor.submit(self.fetch_lyrics, artist, song, False)
+                for artist, song in songs
+            ]
+
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(LyricsResult(success=False, error=str(e)))
+            return results
+
     def fetch_from_source(self, artist: str, song: str, source: str) -> LyricsResult:
         """
         Fetch lyrics from a specific source.
@@ -83,7 +174,7 @@ class LyricsSourceManager:
         """
         for fetcher in self._fetchers:
             if fetcher.name.lower() == source.lower():
-                return fetcher.fetch(artist, song)
+                return fetcher.fetch(artist, song, slugify(artist, '-'), slugify(song, '-'))
 
         return LyricsResult(
             success=False,
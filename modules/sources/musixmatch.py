@@ -2,10 +2,13 @@
 Musixmatch.com lyrics fetcher.
 """
 
-import html
 import re
+from typing import Optional
 
-from .base import BaseLyricsFetcher, LyricsResult
+from .base import BaseLyricsFetcher, LyricsResult, is_not_found, slugify
+
+# Runs on the raw response bytes; only the lyrics spans are decoded
+_LYRICS_SPAN_RE = re.compile(rb'<span[^>]*class="[^"]*lyrics[^"]*"[^>]*>(.*?)</span>', re.DOTALL)
 
 
 class MusixmatchFetcher(BaseLyricsFetcher):
@@ -15,25 +18,26 @@ class MusixmatchFetcher(BaseLyricsFetcher):
     def priority(self) -> int:
         return 3
 
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """Search and extract lyrics from Musixmatch."""
         try:
             # Clean artist and song names for URL
-            artist_clean = re.sub(r'[^a-zA-Z0-9]', '-', artist).lower().strip('-')
-            song_clean = re.sub(r'[^a-zA-Z0-9]', '-', song).lower().strip('-')
+            artist_clean = artist_slug or slugify(artist, '-')
+            song_clean = song_slug or slugify(song, '-')
             url = f"https://www.musixmatch.com/lyrics/{artist_clean}/{song_clean}"
 
             with self._make_request(url, timeout=30) as response:
-                html_content = response.read().decode('utf-8')
+                html_content = response.read()
 
                 # Extract lyrics spans
-                lyrics_spans = re.findall(
-                    r'<span[^>]*class="[^"]*lyrics[^"]*"[^>]*>(.*?)</span>',
-                    html_content, re.DOTALL
-                )
+                lyrics_spans = _LYRICS_SPAN_RE.findall(html_content)
 
                 if lyrics_spans:
-                    lyrics = self._clean_lyrics('\n'.join(lyrics_spans))
+                    lyrics = self._clean_lyrics(
+                        b'\n'.join(lyrics_spans).decode('utf-8', errors='replace')
+                    )
                     if lyrics:
                         return LyricsResult(
                             success=True,
@@ -44,29 +48,6 @@ class MusixmatchFetcher(BaseLyricsFetcher):
                         )
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
         return LyricsResult(success=False, error="Lyrics not found")
-
-    def _clean_lyrics(self, content: str) -> str:
-        """Clean lyrics content."""
-        if not content:
-            return ""
-
-        # Decode HTML entities
-        text = html.unescape(content)
-
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-
-        # Remove excessive blank lines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-
-        # Strip each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-
-        return text.strip()
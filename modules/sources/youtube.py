@@ -3,11 +3,49 @@ YouTube lyrics fetcher.
 Extracts lyrics from YouTube video descriptions.
 """
 
+import json
 import re
-import html
 import urllib.request
 import urllib.parse
-from .base import BaseLyricsFetcher, LyricsResult
+from typing import Optional
+
+from .base import BaseLyricsFetcher, LyricsResult, first_in_order, is_not_found, read_until
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+}
+
+# Runs on the raw search page bytes; the page itself is never decoded
+_VIDEO_ID_RE = re.compile(rb'/watch\?v=([a-zA-Z0-9_-]{11})')
+_LYRICS_MARKER_RE = re.compile(
+    r'(?:Lyrics|LYRICS|歌词)[:\s]*\n?(.*?)(?:\n\n|\Z|Subscribe|Follow|Instagram|Twitter)',
+    re.IGNORECASE | re.DOTALL
+)
+_META_DESCRIPTION_RE = re.compile(r'<meta[^>]*name="description"[^>]*content="([^"]*)"')
+# The full description lives in this embedded JSON object
+_PLAYER_RESPONSE_MARKER = 'ytInitialPlayerResponse = '
+_PLAYER_RESPONSE_MARKER_BYTES = _PLAYER_RESPONSE_MARKER.encode('ascii')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _short_description(video_html: str) -> Optional[str]:
+    """
+    Return ``videoDetails.shortDescription`` from the embedded player response.
+
+    ``raw_decode`` parses just the one object after the marker, so the end of
+    the JSON doesn't have to be located first. Returns None when it is absent.
+    """
+    start = video_html.find(_PLAYER_RESPONSE_MARKER)
+    if start == -1:
+        return None
+    try:
+        data, _ = _JSON_DECODER.raw_decode(video_html, start + len(_PLAYER_RESPONSE_MARKER))
+    except ValueError:
+        return None
+    details = data.get('videoDetails') if isinstance(data, dict) else None
+    description = details.get('shortDescription') if isinstance(details, dict) else None
+    return description if isinstance(description, str) else None
 
 
 class YouTubeFetcher(BaseLyricsFetcher):
@@ -17,37 +55,47 @@ class YouTubeFetcher(BaseLyricsFetcher):
     def priority(self) -> int:
         return 5
 
-    def fetch(self, artist: str, song: str) -> LyricsResult:
+    def fetch(self, artist: str, song: str,
+              artist_slug: Optional[str] = None,
+              song_slug: Optional[str] = None) -> LyricsResult:
         """Search YouTube for lyrics in video descriptions."""
         query = f"{artist} {song} lyrics"
         search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(query)}"
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept-Language': 'en-US,en;q=0.9'
-        }
+        headers = _HEADERS
 
         try:
             # Search for videos
             with self._make_request(search_url, headers=headers, timeout=30) as response:
-                html_content = response.read().decode('utf-8')
+                html_content = response.read()
 
-                # Extract video IDs
-                video_ids = re.findall(r'/watch\?v=([a-zA-Z0-9_-]{11})', html_content)
+            # Extract video IDs
+            video_ids = [video_id.decode('ascii') for video_id in _VIDEO_ID_RE.findall(html_content)]
 
-                if not video_ids:
-                    return LyricsResult(success=False, error="No videos found")
+            if not video_ids:
+                return LyricsResult(success=False, error="No videos found")
 
-                # Try first few videos
-                for video_id in video_ids[:3]:
-                    result = self._try_video_description(video_id, headers)
-                    if result.success:
-                        return result
+            # Probe the first few videos concurrently, preferring earlier ones
+            video_ids = video_ids[:3]
+            probes = []
+
+            def probe(video_id: str) -> LyricsResult:
+                result = self._try_video_description(video_id, headers)
+                probes.append(result)
+                return result
+
+            result = first_in_order(probe, video_ids, lambda result: result.success)
+            if result is not None:
+                return result
 
         except Exception as e:
-            return LyricsResult(success=False, error=str(e))
+            return LyricsResult(success=False, error=str(e), not_found=is_not_found(e))
 
-        return LyricsResult(success=False, error="No lyrics found in YouTube descriptions")
+        return LyricsResult(
+            success=False,
+            error="No lyrics found in YouTube descriptions",
+            not_found=len(probes) == len(video_ids) and all(p.not_found for p in probes)
+        )
 
     def _try_video_description(self, video_id: str, headers: dict) -> LyricsResult:
         """Try to extract lyrics from a video description."""
@@ -55,70 +103,40 @@ class YouTubeFetcher(BaseLyricsFetcher):
 
         try:
             with self._make_request(video_url, headers=headers, timeout=30) as response:
-                video_html = response.read().decode('utf-8')
-
-                # Method 1: Look for lyrics markers in description
-                lyrics_match = re.search(
-                    r'(?:Lyrics|LYRICS|歌词)[:\s]*\n?(.*?)(?:\n\n|\Z|Subscribe|Follow|Instagram|Twitter)',
-                    video_html,
-                    re.IGNORECASE | re.DOTALL
-                )
-
-                if lyrics_match:
-                    lyrics = self._clean_lyrics(lyrics_match.group(1))
-                    if len(lyrics) > 100:
-                        return LyricsResult(
-                            success=True,
-                            title=f"{video_id} (YouTube)",
-                            artist="YouTube",
-                            lyrics=lyrics,
-                            source="YouTube"
-                        )
-
-                # Method 2: Look for description in meta tag
-                desc_match = re.search(
-                    r'<meta[^>]*name="description"[^>]*content="([^"]*)"',
-                    video_html
-                )
-
-                if desc_match:
-                    description = desc_match.group(1)
-                    # Check if description contains lyrics markers
-                    if '[' in description and len(description) > 200:
-                        lyrics = self._clean_lyrics(description)
-                        if lyrics:
-                            return LyricsResult(
-                                success=True,
-                                title=f"{video_id} (YouTube)",
-                                artist="YouTube",
-                                lyrics=lyrics,
-                                source="YouTube"
-                            )
-
+                # The player response is an inline script, so stop once it closes
+                video_html = read_until(
+                    response, _PLAYER_RESPONSE_MARKER_BYTES, b'</script>'
+                ).decode('utf-8', errors='replace')
         except Exception:
-            pass
-
-        return LyricsResult(success=False, error="Failed to extract from video")
-
-    def _clean_lyrics(self, content: str) -> str:
-        """Clean lyrics content."""
-        if not content:
-            return ""
-
-        # Decode HTML entities
-        text = html.unescape(content)
-
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-
-        # Remove excessive blank lines
-        text = re.sub(r'\n{3,}', '\n\n', text)
-
-        # Strip each line
-        lines = [line.strip() for line in text.split('\n')]
-        text = '\n'.join(lines)
-
-        return text.strip()
+            return LyricsResult(success=False, error="Failed to extract from video")
+
+        # Only scan the real description, falling back to the meta tag copy
+        description = _short_description(video_html)
+        if description is None:
+            desc_match = _META_DESCRIPTION_RE.search(video_html)
+            description = desc_match.group(1) if desc_match else ""
+
+        lyrics = self._description_lyrics(description)
+        if not lyrics:
+            return LyricsResult(success=False, error="No lyrics in video description", not_found=True)
+
+        return LyricsResult(
+            success=True,
+            title=f"{video_id} (YouTube)",
+            artist="YouTube",
+            lyrics=lyrics,
+            source="YouTube"
+        )
+
+    def _description_lyrics(self, description: str) -> Optional[str]:
+        """Pull lyrics out of a plain-text video description, if it has any."""
+        lyrics_match = _LYRICS_MARKER_RE.search(description)
+        if lyrics_match:
+            lyrics = self._clean_lyrics(lyrics_match.group(1))
+            if len(lyrics) > 100:
+                return lyrics
+
+        if '[' in description and len(description) > 200:
+            return self._clean_lyrics(description) or None
+
+        return None
@@ -3,19 +3,31 @@ Baidu Translate API implementation.
 """
 
 import hashlib
-import json
 import random
 import urllib.request
 import urllib.parse
-from .base import BaseTranslator
+from typing import List, Optional
+from .base import BaseTranslator, RateLimiter
+from ..utils import json_loads
+
+# Language mapping
+_LANG_MAP = {'auto': 'auto', 'en': 'en', 'zh': 'zh', 'zh-CN': 'zh', 'ja': 'jp', 'ko': 'kor'}
+
+# Baidu recommends keeping q under 6000 bytes per request
+_MAX_QUERY_BYTES = 5000
 
 
 class BaiduTranslator(BaseTranslator):
     """Baidu Translate API."""
 
+    supports_batch = True
+
     def __init__(self, appid: str, secret_key: str):
         self.appid = appid
         self.secret_key = secret_key
+        # Encoded once; every request signs appid + q + salt + secret_key
+        self._appid_bytes = appid.encode()
+        self._secret_bytes = secret_key.encode()
         self.api_url = 'https://fanyi-api.baidu.com/api/trans/vip/translate'
 
     @property
@@ -30,14 +42,68 @@ class BaiduTranslator(BaseTranslator):
         if not text.strip() or not self.is_available:
             return text
 
-        # Language mapping
-        lang_map = {'auto': 'auto', 'en': 'en', 'zh': 'zh', 'zh-CN': 'zh', 'ja': 'jp', 'ko': 'kor'}
-        from_lang = lang_map.get(source, source)
-        to_lang = lang_map.get(target, target)
+        translated = self._request(text, source, target)
+        if translated:
+            return '\n'.join(translated)
+
+        return text
+
+    def translate_lines(self, lines: List[str], source: str = 'auto', target: str = 'zh',
+                        delay: float = 0.0) -> List[str]:
+        """
+        Translate many lines with as few requests as possible.
+
+        Lines are sent newline-joined in chunks under the API's size limit;
+        Baidu answers with one ``trans_result`` entry per input line. Every
+        request, including per-line fallbacks, starts at least ``delay``
+        after the previous one, since the standard tier allows 1 QPS.
+        """
+        if not self.is_available:
+            return list(lines)
+
+        limiter = RateLimiter(delay)
+        results = []
+        chunk, size = [], 0
+        for line in lines:
+            line_size = len(line.encode()) + 1
+            if chunk and size + line_size > _MAX_QUERY_BYTES:
+                results.extend(self._translate_chunk(chunk, source, target, limiter))
+                chunk, size = [], 0
+            chunk.append(line)
+            size += line_size
+        if chunk:
+            results.extend(self._translate_chunk(chunk, source, target, limiter))
+
+        return results
+
+    def _translate_chunk(self, lines: List[str], source: str, target: str,
+                         limiter: RateLimiter) -> List[str]:
+        """Translate one newline-joined chunk, falling back to per-line calls."""
+        limiter.wait()
+        translated = self._request('\n'.join(lines), source, target)
+        if translated and len(translated) == len(lines):
+            return translated
+        # Blank or multi-line entries break the 1:1 mapping; translate individually
+        results = []
+        for line in lines:
+            limiter.wait()
+            results.append(self.translate(line, source, target))
+        return results
+
+    def _request(self, text: str, source: str, target: str) -> Optional[List[str]]:
+        """Send one translation request; return the translated lines or None."""
+        from_lang = _LANG_MAP.get(source, source)
+        to_lang = _LANG_MAP.get(target, target)
 
         salt = random.randint(32768, 65536)
-        sign_str = self.appid + text + str(salt) + self.secret_key
-        sign = hashlib.md5(sign_str.encode()).hexdigest()
+        # The signature is a checksum over public parameters, not a security
+        # boundary, so skip the FIPS gate and feed the parts in without concatenating
+        digest = hashlib.md5(usedforsecurity=False)
+        digest.update(self._appid_bytes)
+        digest.update(text.encode())
+        digest.update(str(salt).encode())
+        digest.update(self._secret_bytes)
+        sign = digest.hexdigest()
 
         params = {
             'q': text,
@@ -49,13 +115,15 @@ class BaiduTranslator(BaseTranslator):
         }
 
         try:
-            url = self.api_url + '?' + urllib.parse.urlencode(params)
-            req = urllib.request.Request(url)
+            # POST so a whole lyric fits without hitting URL length limits
+            data = urllib.parse.urlencode(params).encode('utf-8')
+            req = urllib.request.Request(self.api_url, data=data, method='POST')
+            req.add_header('Content-Type', 'application/x-www-form-urlencoded')
             with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
+                result = json_loads(response.read())
                 if 'trans_result' in result:
-                    return '\n'.join([item['dst'] for item in result['trans_result']])
+                    return [item['dst'] for item in result['trans_result']]
         except Exception:
             pass
 
-        return text
+        return None
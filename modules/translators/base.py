@@ -2,9 +2,11 @@
 Base translator class.
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -17,9 +19,35 @@ class TranslationResult:
     error: Optional[str] = None
 
 
+class RateLimiter:
+    """
+    Space request starts at least ``interval`` seconds apart across threads.
+
+    Requests may still overlap in flight; only when each one starts is paced,
+    so several workers together send no faster than one serial loop would.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        """Block until the caller may start its next request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
 class BaseTranslator(ABC):
     """Abstract base class for translators."""
 
+    # True if translate_lines() sends many lines in one request
+    supports_batch = False
+
     @abstractmethod
     def translate(self, text: str, source: str = 'auto', target: str = 'zh') -> str:
         """Translate text and return result."""
@@ -36,3 +64,17 @@ class BaseTranslator(ABC):
     def is_available(self) -> bool:
         """Check if translator is properly configured."""
         pass
+
+    def translate_lines(self, lines: List[str], source: str = 'auto', target: str = 'zh',
+                        delay: float = 0.0) -> List[str]:
+        """Translate single-line texts, starting requests at least ``delay`` apart."""
+        limiter = RateLimiter(delay)
+        results = []
+        for line in lines:
+            limiter.wait()
+            results.append(self.translate(line, source, target))
+        return results
+
+    def close(self):
+        """Release network resources held by the translator."""
+        pass
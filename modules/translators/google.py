@@ -2,11 +2,17 @@
 Google Translate implementation.
 """
 
-import re
-import time
-from typing import List, Dict
-from .base import BaseTranslator
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+from .base import BaseTranslator, RateLimiter
 from ..proxy import get_config
+from ..utils import is_section_marker
+
+# Lines packed into one request; deep_translator rejects payloads over 5000 chars
+BATCH_LINES = 20
+BATCH_CHARS = 4500
 
 
 class GoogleTranslator(BaseTranslator):
@@ -14,7 +20,24 @@ class GoogleTranslator(BaseTranslator):
 
     def __init__(self):
         self._translator = None
-        self._init_translator()
+        self._translator_class = None
+        self._proxies = None
+        # deep_translator keeps per-request state on the instance, so each
+        # batch worker thread gets its own translator
+        self._local = threading.local()
+        # deep_translator is imported and set up on first use, so managers
+        # that never fall back to Google don't pay for it
+        self._init_attempted = False
+        self._init_lock = threading.Lock()
+
+    def _ensure_translator(self):
+        """Initialize the translator on first use; return it or None."""
+        if not self._init_attempted:
+            with self._init_lock:
+                if not self._init_attempted:
+                    self._init_translator()
+                    self._init_attempted = True
+        return self._translator
 
     def _init_translator(self):
         try:
@@ -34,48 +57,114 @@ class GoogleTranslator(BaseTranslator):
                         "https": https_proxy if https_proxy else http_proxy
                     }
             
-            # Initialize translator with proxy
-            if proxies:
-                self._translator = GT(source='auto', target='zh-CN', proxies=proxies)
-            else:
-                self._translator = GT(source='auto', target='zh-CN')
+            self._translator_class = GT
+            self._proxies = proxies
+            self._translator = self._new_translator()
         except ImportError:
             self._translator = None
 
+    def _new_translator(self):
+        """Create a deep_translator instance with the configured proxy."""
+        if self._proxies:
+            return self._translator_class(source='auto', target='zh-CN', proxies=self._proxies)
+        return self._translator_class(source='auto', target='zh-CN')
+
+    def _thread_translator(self):
+        """Return the calling thread's own translator instance."""
+        translator = getattr(self._local, 'translator', None)
+        if translator is None:
+            translator = self._local.translator = self._new_translator()
+        return translator
+
     @property
     def name(self) -> str:
         return "Google Translate"
 
     @property
     def is_available(self) -> bool:
-        return self._translator is not None
+        if self._init_attempted:
+            return self._translator is not None
+        # Cheap check that doesn't import the package
+        return importlib.util.find_spec('deep_translator') is not None
 
     def translate(self, text: str, source: str = 'auto', target: str = 'zh') -> str:
         if not text.strip():
             return text
 
         # Don't translate section markers
-        if re.match(r'^\[.+\]$', text.strip()):
+        if is_section_marker(text):
             return text.strip()
 
-        if not self._translator:
+        translator = self._ensure_translator()
+        if not translator:
             return text
 
         try:
-            return self._translator.translate(text)
+            return translator.translate(text)
         except Exception:
             return text
 
-    def translate_batch(self, texts: List[str], delay: float = 0.5) -> Dict[str, str]:
-        """Translate multiple texts with rate limiting."""
+    def translate_batch(self, texts: List[str], delay: float = 0.5,
+                        concurrency: int = 8) -> Dict[str, str]:
+        """
+        Translate multiple texts with rate limiting.
+
+        Lines are packed newline-joined into requests of up to ``BATCH_LINES``
+        lines, and up to ``concurrency`` requests are in flight at once.
+        Request starts are spaced ``delay`` apart across all workers, so the
+        rate matches the serial one-per-``delay`` pacing.
+        """
         results = {}
+        pending = []
 
-        for i, text in enumerate(texts):
-            if text.strip() and not re.match(r'^\[.+\]$', text.strip()):
-                results[text] = self.translate(text)
-                if i < len(texts) - 1:
-                    time.sleep(delay)
+        for text in texts:
+            if text in results:
+                continue  # repeated line: translate it once
+            if text.strip() and not is_section_marker(text):
+                pending.append(text)
+                results[text] = text  # filled in below, keeps input order
             else:
                 results[text] = text.strip() if text.strip() else text
 
+        if not pending or not self._ensure_translator():
+            return results
+
+        limiter = RateLimiter(delay)
+
+        def request(translator, text: str) -> Optional[str]:
+            limiter.wait()
+            try:
+                return translator.translate(text)
+            except Exception:
+                return None
+
+        def translate_chunk(chunk: List[str]) -> List[str]:
+            translator = self._thread_translator()
+            translated = request(translator, '\n'.join(chunk))
+            if translated:
+                lines = translated.split('\n')
+                if len(lines) == len(chunk):
+                    return lines
+            # Failed, or lines were merged/split in translation; redo one by one
+            return [request(translator, text) or text for text in chunk]
+
+        chunks = self._chunk_lines(pending)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(chunks))) as executor:
+            for chunk, translated in zip(chunks, executor.map(translate_chunk, chunks)):
+                results.update(zip(chunk, translated))
+
         return results
+
+    def _chunk_lines(self, lines: List[str]) -> List[List[str]]:
+        """Group lines into newline-joinable chunks within the request limits."""
+        chunks = []
+        chunk, size = [], 0
+        for line in lines:
+            if chunk and (len(chunk) >= BATCH_LINES or size + len(line) + 1 > BATCH_CHARS):
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(line)
+            size += len(line) + 1
+        if chunk:
+            chunks.append(chunk)
+        return chunks
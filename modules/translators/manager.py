@@ -2,13 +2,19 @@
 Translation manager - coordinates multiple translation services.
 """
 
-import time
-from typing import List, Dict
-from .base import BaseTranslator
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple
+from .base import BaseTranslator, RateLimiter
 from .google import GoogleTranslator
 from .baidu import BaiduTranslator
 from .youdao import YoudaoTranslator
 
+CACHE_SIZE = 4096
+# Concurrent requests for line-by-line API translators (config key "workers")
+DEFAULT_WORKERS = 8
+
 
 class TranslationManager:
     """Manager for multiple translation services with fallback."""
@@ -16,6 +22,9 @@ class TranslationManager:
     def __init__(self, config: Dict = None):
         self.config = config or {}
         self.translators: List[BaseTranslator] = []
+        # (text, source, target) -> translation; choruses repeat the same lines
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._init_translators()
 
     def _init_translators(self):
@@ -45,41 +54,127 @@ class TranslationManager:
 
     def translate(self, text: str, source: str = 'auto', target: str = 'zh') -> str:
         """Try translators in order until one succeeds."""
+        key = (text, source, target)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
         for translator in self.translators:
             try:
                 result = translator.translate(text, source, target)
                 if result and result != text:
+                    self._remember(key, result)
                     return result
             except Exception:
                 continue
         return text
 
+    def _cached(self, key: Tuple[str, str, str]) -> Optional[str]:
+        """Look up a translation in the LRU cache, marking it recently used."""
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def _remember(self, key: Tuple[str, str, str], translation: str):
+        """Add to the LRU translation cache, evicting the oldest entry when full."""
+        with self._cache_lock:
+            self._cache[key] = translation
+            self._cache.move_to_end(key)
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
     def translate_batch(self, texts: List[str], delay: float = 0.5) -> Dict[str, str]:
-        """Batch translate using the first available translator."""
+        """Batch translate, sending only lines missing from the translation cache."""
         if not self.translators:
             return {text: text for text in texts}
 
+        results = {}
+        misses = []
+        for text in texts:
+            if text in results:
+                continue  # repeated line (e.g. a chorus): translate it once
+            cached = self._cached((text, 'auto', 'zh'))
+            if cached is not None:
+                results[text] = cached
+            else:
+                results[text] = text  # filled in below, keeps input order
+                misses.append(text)
+
+        if misses:
+            translated = self._translate_batch_uncached(misses, delay)
+            for text in misses:
+                translation = translated.get(text, text)
+                results[text] = translation
+                if translation and translation != text.strip():
+                    self._remember((text, 'auto', 'zh'), translation)
+
+        return results
+
+    def _translate_batch_uncached(self, texts: List[str], delay: float) -> Dict[str, str]:
+        """Batch translate using the first available translator."""
+
         # Use first available (priority: Youdao > Baidu > Google)
         for translator in self.translators:
             if isinstance(translator, GoogleTranslator):
                 return translator.translate_batch(texts, delay)
-            else:
-                # For API-based translators, translate one by one
-                results = {}
-                for i, text in enumerate(texts):
-                    if text.strip():
-                        results[text] = translator.translate(text)
-                        if (i + 1) % 10 == 0:
-                            print(f"    Progress: {i + 1}/{len(texts)}")
-                        if i < len(texts) - 1:
-                            time.sleep(delay)
-                    else:
-                        results[text] = text
+            elif translator.supports_batch:
+                # One request per chunk of lines, started delay apart
+                lines = [text for text in texts if text.strip()]
+                results = {text: text for text in texts}
+                results.update(zip(lines, translator.translate_lines(lines, delay=delay)))
                 return results
+            else:
+                # For API-based translators, one line per request on a worker pool
+                return self._translate_concurrently(translator, texts, delay)
 
         # Fallback
         return {text: text for text in texts}
 
+    def _translate_concurrently(self, translator: BaseTranslator, texts: List[str],
+                                delay: float) -> Dict[str, str]:
+        """
+        Translate line by line with several requests in flight.
+
+        Request starts are spaced ``delay`` apart across all workers, so the
+        API sees the serial one-per-``delay`` rate; the workers only overlap
+        the time spent waiting for responses.
+        """
+        results = {text: text for text in texts}
+        lines = [text for text in texts if text.strip()]
+        if not lines:
+            return results
+
+        workers = min(self.config.get('workers', DEFAULT_WORKERS), len(lines))
+        limiter = RateLimiter(delay)
+
+        def translate_one(text: str) -> str:
+            limiter.wait()
+            return translator.translate(text)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(translate_one, text): text for text in lines}
+            for done, future in enumerate(as_completed(futures), 1):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    pass
+                if done % 10 == 0:
+                    print(f"    Progress: {done}/{len(lines)}")
+
+        return results
+
+    def clear_cache(self):
+        """Drop all cached translations."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self):
+        """Release pooled connections held by the translators."""
+        for translator in self.translators:
+            translator.close()
+
     @property
     def available_translators(self) -> List[str]:
         """List names of available translators."""
@@ -4,11 +4,21 @@ Youdao Translate API implementation.
 
 import time
 import hashlib
-import json
 import uuid
 import urllib.request
 import urllib.parse
 from .base import BaseTranslator
+from ..proxy import make_retry
+from ..utils import json_loads
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+# Language mapping
+_LANG_MAP = {'auto': 'auto', 'en': 'en', 'zh': 'zh-CHS', 'zh-CN': 'zh-CHS'}
 
 
 class YoudaoTranslator(BaseTranslator):
@@ -18,6 +28,18 @@ class YoudaoTranslator(BaseTranslator):
         self.appkey = appkey
         self.secret_key = secret_key
         self.api_url = 'https://openapi.youdao.com/api'
+        # Every signature starts with appkey; hash it once and copy the state
+        self._sign_base = hashlib.sha256(appkey.encode())
+        self._secret_bytes = secret_key.encode()
+        # Request fields that are the same for every call
+        self._base_params = {'appKey': appkey, 'signType': 'v3'}
+        self._session = None
+        if requests is not None and self.is_available:
+            # One keep-alive connection pool for every line sent to the API
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                                  max_retries=make_retry(methods=('POST',)))
+            self._session.mount('https://', adapter)
 
     @property
     def name(self) -> str:
@@ -37,37 +59,50 @@ class YoudaoTranslator(BaseTranslator):
         if not text.strip() or not self.is_available:
             return text
 
-        # Language mapping
-        lang_map = {'auto': 'auto', 'en': 'en', 'zh': 'zh-CHS', 'zh-CN': 'zh-CHS'}
-        from_lang = lang_map.get(source, source)
-        to_lang = lang_map.get(target, target)
+        from_lang = _LANG_MAP.get(source, source)
+        to_lang = _LANG_MAP.get(target, target)
 
         curtime = str(int(time.time()))
-        salt = str(uuid.uuid1())
-        sign_str = self.appkey + self._truncate(text) + salt + curtime + self.secret_key
-        sign = hashlib.sha256(sign_str.encode()).hexdigest()
+        salt = uuid.uuid4().hex
+        digest = self._sign_base.copy()
+        digest.update((self._truncate(text) + salt + curtime).encode())
+        digest.update(self._secret_bytes)
+        sign = digest.hexdigest()
 
         params = {
+            **self._base_params,
             'q': text,
             'from': from_lang,
             'to': to_lang,
-            'appKey': self.appkey,
             'salt': salt,
             'sign': sign,
-            'signType': 'v3',
             'curtime': curtime
         }
 
         try:
-            data = urllib.parse.urlencode(params).encode('utf-8')
-            req = urllib.request.Request(self.api_url, data=data, method='POST')
-            req.add_header('Content-Type', 'application/x-www-form-urlencoded')
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                if result.get('errorCode') == '0':
-                    return result.get('translation', [text])[0]
+            result = json_loads(self._post(params))
+            if result.get('errorCode') == '0':
+                return result.get('translation', [text])[0]
         except Exception:
             pass
 
         return text
+
+    def _post(self, params: dict) -> bytes:
+        """POST form parameters to the API and return the raw response body."""
+        if self._session is not None:
+            response = self._session.post(self.api_url, data=params, timeout=30)
+            return response.content
+
+        data = urllib.parse.urlencode(params).encode('utf-8')
+        req = urllib.request.Request(self.api_url, data=data, method='POST')
+        req.add_header('Content-Type', 'application/x-www-form-urlencoded')
+
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.read()
+
+    def close(self):
+        """Close the pooled session, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
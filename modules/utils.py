@@ -2,20 +2,37 @@
 Utility functions for lyrics processing.
 """
 
+import copy
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SECTION_RE = re.compile(r'^\[.+\]$')
+# Characters Windows rejects in filenames, plus the full-width colon
+_FILENAME_BAD_CHARS = str.maketrans('', '', '<>:："/\\|?*')
+
+# Parse JSON API responses straight from bytes; orjson is faster when installed
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# (path, mtime) stamps of the existing candidates -> parsed config
+_CONFIG_CACHE: dict = {}
+
 
 def is_section_marker(line: str) -> bool:
     """Check if a line is a section marker like [Verse 1], [Chorus]."""
-    return bool(re.match(r'^\[.+\]$', line.strip()))
+    return bool(_SECTION_RE.match(line.strip()))
 
 
 def sanitize_filename(name: str) -> str:
     """Remove invalid characters from filename."""
-    return re.sub(r'[<>："/\\|?*]', '', name).strip()
+    return name.translate(_FILENAME_BAD_CHARS).strip()
 
 
 def parse_lyrics_file(filepath: str) -> Tuple[Optional[str], Optional[str], List[str]]:
@@ -41,7 +58,8 @@ def parse_lyrics_file(filepath: str) -> Tuple[Optional[str], Optional[str], List
         return None, None, []
 
 
-def save_lyrics(artist: str, song: str, lyrics: str, output_path: str) -> str:
+def save_lyrics(artist: str, song: str, lyrics: str, output_path: str,
+                make_dirs: bool = True) -> str:
     """
     Save lyrics to a file in clean format.
     
@@ -50,6 +68,7 @@ def save_lyrics(artist: str, song: str, lyrics: str, output_path: str) -> str:
         song: Song title
         lyrics: Lyrics content
         output_path: Output directory path
+        make_dirs: Create ``output_path`` first; batch callers do it once up front
         
     Returns:
         Full filepath of saved file
@@ -57,13 +76,13 @@ def save_lyrics(artist: str, song: str, lyrics: str, output_path: str) -> str:
     safe_artist = sanitize_filename(artist)
     safe_song = sanitize_filename(song)
 
-    filename = f"{safe_artist} - {safe_song}.txt"
-    filepath = Path(output_path) / filename
+    directory = Path(output_path)
+    filepath = directory / f"{safe_artist} - {safe_song}.txt"
 
-    Path(output_path).mkdir(parents=True, exist_ok=True)
+    if make_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(lyrics)
+    filepath.write_text(lyrics, encoding='utf-8')
 
     return str(filepath)
 
@@ -72,6 +91,9 @@ def load_config(config_paths: Optional[List[str]] = None) -> dict:
     """
     Load configuration from config.json files.
     
+    Results are cached until one of the candidate files changes. Each call
+    gets its own copy, so callers may modify the returned dict freely.
+    
     Args:
         config_paths: List of possible config file paths
         
@@ -83,13 +105,27 @@ def load_config(config_paths: Optional[List[str]] = None) -> dict:
             str(Path.cwd() / "config.json"),
         ]
 
+    # Key on which candidates exist and when they were last modified
+    stamps = []
     for path in config_paths:
-        path_obj = Path(path)
-        if path_obj.exists():
-            try:
-                with open(path_obj, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-
-    return {"proxy": {"enabled": False}, "translation": {}}
+        try:
+            stamps.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+    key = tuple(stamps)
+
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    config = {"proxy": {"enabled": False}, "translation": {}}
+    for path, _ in stamps:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            break
+        except Exception:
+            pass
+
+    _CONFIG_CACHE[key] = config
+    return copy.deepcopy(config)
@@ -6,8 +6,17 @@ Uses modular sources from modules.sources
 Usage:
     python download_lyrics.py "Artist Name" "Song Title" [output_path]
     python download_lyrics.py "Beyond Awareness" "Crime" "./lyrics/"
+    python download_lyrics.py --batch songs.csv [output_path]
+
+A batch CSV holds one "artist,song" pair per row (UTF-8, optional header row).
+
+Found lyrics are cached for 30 days; pass --refresh to ignore the cache and
+query the sources again. Songs every source reported missing are remembered
+for a few hours so repeated lookups fail fast; timeouts and connection errors
+are never remembered. Pass --no-negative-cache to turn that off.
 """
 
+import csv
 import io
 import sys
 from pathlib import Path
@@ -24,10 +33,77 @@ from modules.utils import load_config, save_lyrics
 from modules.proxy import get_proxy_opener
 
 
+# Optional first row of a batch CSV
+CSV_HEADERS = {("artist", "song"), ("artist", "title")}
+
+
+def read_song_list(csv_path):
+    """
+    Read (artist, song) pairs from a CSV file.
+
+    Each row holds an artist and a song title; extra columns and rows with an
+    empty cell are ignored, and a leading "artist,song" header row is skipped.
+    """
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        rows = [
+            (row[0].strip(), row[1].strip())
+            for row in csv.reader(f)
+            if len(row) >= 2 and row[0].strip() and row[1].strip()
+        ]
+    if rows and (rows[0][0].lower(), rows[0][1].lower()) in CSV_HEADERS:
+        rows = rows[1:]
+    return rows
+
+
+def download_batch(manager, csv_path, output_path):
+    """Download lyrics for every "artist,song" row of a CSV file concurrently."""
+    try:
+        songs = read_song_list(csv_path)
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        print(f"[X] Could not read song list {csv_path}: {e}")
+        print('    Expected a UTF-8 CSV file with one "artist,song" pair per row.')
+        sys.exit(1)
+
+    print(f"Searching for {len(songs)} songs...")
+    print()
+
+    # One process and one connection pool for the whole list
+    results = manager.fetch_many(songs)
+
+    Path(output_path).mkdir(parents=True, exist_ok=True)
+    saved = 0
+    for (artist, song), result in zip(songs, results):
+        if result.success and result.lyrics:
+            filepath = save_lyrics(
+                result.artist or artist, result.title or song, result.lyrics, output_path,
+                make_dirs=False,
+            )
+            print(f"[OK] {artist} - {song} ({result.source}): {filepath}")
+            saved += 1
+        else:
+            print(f"[X] {artist} - {song}: {result.error or 'Lyrics not found'}")
+
+    print()
+    print(f"Saved {saved}/{len(songs)} lyrics to: {output_path}")
+    if saved < len(songs):
+        sys.exit(1)
+
+
 def main():
-    if len(sys.argv) < 3:
+    flags = {"--no-negative-cache", "--refresh"}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    cache_misses = "--no-negative-cache" not in sys.argv[1:]
+    use_cache = "--refresh" not in sys.argv[1:]
+
+    if len(args) < 2:
         print('Usage: python download_lyrics.py "Artist Name" "Song Title" [output_path]')
         print('       python download_lyrics.py "Beyond Awareness" "Crime" "./lyrics/"')
+        print('       python download_lyrics.py --batch songs.csv [output_path]')
+        print("")
+        print("Batch mode reads one \"artist,song\" pair per CSV row; an \"artist,song\"")
+        print("header row is optional.")
+        print("Add --refresh to skip cached lyrics and query the sources again.")
+        print("Add --no-negative-cache to retry songs that recently were not found.")
         print("")
         print("Proxy Configuration:")
         print("  Create config.json in the skill directory to enable proxy support.")
@@ -43,9 +119,10 @@ def main():
         print("Output format: Clean lyrics with [Verse], [Chorus] markers preserved")
         sys.exit(1)
 
-    artist = sys.argv[1]
-    song = sys.argv[2]
-    output_path = sys.argv[3] if len(sys.argv) > 3 else "."
+    batch_file = args[1] if args[0] == "--batch" else None
+    artist = args[0]
+    song = args[1]
+    output_path = args[2] if len(args) > 2 else "."
 
     # Load config and initialize proxy
     possible_paths = [
@@ -64,12 +141,16 @@ def main():
         if proxy_config.get("https"):
             print(f"  [Proxy] HTTPS: {proxy_config['https']}")
 
+    manager = LyricsSourceManager(proxy_opener, use_cache=use_cache, cache_misses=cache_misses)
+    if batch_file:
+        download_batch(manager, batch_file, output_path)
+        return
+
     print(f"Searching for: {artist} - {song}")
     print("Will try multiple sources...")
     print()
 
     # Use LyricsSourceManager to fetch lyrics
-    manager = LyricsSourceManager(proxy_opener)
     result = manager.fetch_lyrics(artist, song)
 
     if not result.success or not result.lyrics:
@@ -78,6 +159,8 @@ def main():
         print("    - Check the spelling of artist and song title")
         print("    - Try using the original artist name")
         print("    - Some songs may not be available on any lyrics site")
+        if cache_misses:
+            print("    - Confirmed misses are remembered for a few hours; add --no-negative-cache to retry now")
         sys.exit(1)
 
     print()
@@ -5,7 +5,6 @@ Uses modular translators from modules.translators
 """
 
 import io
-import re
 import sys
 from pathlib import Path
 
@@ -17,7 +16,7 @@ if sys.platform == 'win32':
 # Import from modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from modules.translators import TranslationManager
-from modules.utils import load_config, is_section_marker, parse_lyrics_file
+from modules.utils import load_config, is_section_marker, parse_lyrics_file, sanitize_filename
 
 
 def main():
@@ -78,14 +77,13 @@ def main():
             trans_idx += 1
 
     # Save
-    safe_artist = re.sub(r'[<>:"/\\|?*]', '', artist).strip()
-    safe_song = re.sub(r'[<>:"/\\|?*]', '', song).strip()
+    safe_artist = sanitize_filename(artist)
+    safe_song = sanitize_filename(song)
     filename = f"{safe_artist} - {safe_song} (translated chinese).txt"
     filepath = Path(output_path) / filename
     Path(output_path).mkdir(parents=True, exist_ok=True)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(output_lines))
+    filepath.write_text('\n'.join(output_lines), encoding='utf-8')
 
     print(f"[OK] Saved: {filepath}")
 
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Offline tests for the lyrics cache.
+
+The cache is pointed at a temporary directory and sources are replaced by
+fakes, so these run without network access:
+
+    python tests/test_cache.py
+"""
+
+import atexit
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules import cache
+from modules.sources.base import LyricsResult
+from modules.sources.manager import LyricsSourceManager
+
+
+class FakeSource:
+    """Lyrics source that answers with a fixed result, or raises."""
+
+    def __init__(self, name, result):
+        self.name = name
+        self.result = result
+        self.calls = 0
+
+    def fetch(self, artist, song, artist_slug=None, song_slug=None):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def miss(not_found=True):
+    return LyricsResult(success=False, error="Lyrics not found", not_found=not_found)
+
+
+class TempCacheTestCase(unittest.TestCase):
+    """Points the lyrics cache at an empty temporary directory."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.multiple(
+            cache,
+            CACHE_PATH=os.path.join(self._tmp.name, "lyrics_cache"),
+            _shelf=None,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache._memory.clear()
+        cache._misses.clear()
+
+    def tearDown(self):
+        # An empty shelf is falsy, so check for an opened one explicitly
+        if cache._shelf not in (None, False):
+            atexit.unregister(cache._shelf.close)
+            cache._shelf.close()
+        cache._memory.clear()
+        cache._misses.clear()
+        self._tmp.cleanup()
+
+    def manager(self, *results, **options):
+        manager = LyricsSourceManager(**options)
+        manager._fetchers = [FakeSource(f"Source{i}", r) for i, r in enumerate(results)]
+        return manager
+
+
+class CacheTests(TempCacheTestCase):
+
+    def test_hit_from_memory_and_disk(self):
+        found = LyricsResult(success=True, title="Numb", lyrics="la la", source="Genius")
+        cache.put("Linkin Park", "Numb", found)
+        self.assertEqual(cache.get("linkin park", "NUMB!").lyrics, "la la")
+
+        cache._memory.clear()
+        self.assertEqual(cache.get("Linkin Park", "Numb").source, "Genius")
+
+    def test_expired_entry_is_dropped(self):
+        found = LyricsResult(success=True, lyrics="la la", source="Genius")
+        cache.put("Linkin Park", "Numb", found)
+        cache._memory.clear()
+        with mock.patch.object(cache.time, "time", return_value=time.time() + cache.CACHE_TTL + 1):
+            self.assertIsNone(cache.get("Linkin Park", "Numb"))
+        self.assertNotIn(cache.cache_key("Linkin Park", "Numb"), cache._open_shelf())
+
+    def test_corrupt_entry_is_dropped(self):
+        key = cache.cache_key("Linkin Park", "Numb")
+        cache._open_shelf()[key] = {"unknown_field": 1, "expires": time.time() + 60}
+        self.assertIsNone(cache.get("Linkin Park", "Numb"))
+        self.assertNotIn(key, cache._open_shelf())
+
+    def test_manager_hit_skips_sources(self):
+        found = LyricsResult(success=True, lyrics="la la", source="Source0")
+        manager = self.manager(found)
+        manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        self.assertEqual(manager._fetchers[0].calls, 1)
+
+    def test_no_cache_always_fetches(self):
+        found = LyricsResult(success=True, lyrics="la la", source="Source0")
+        manager = self.manager(found, use_cache=False)
+        manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        self.assertEqual(manager._fetchers[0].calls, 2)
+
+    def test_refresh_replaces_stale_entry(self):
+        cache.put("Linkin Park", "Numb", LyricsResult(success=True, lyrics="old", source="Genius"))
+        cache.put_miss("Linkin Park", "Numb", miss())
+
+        fresh = LyricsResult(success=True, lyrics="new", source="Source0")
+        self.manager(fresh, use_cache=False).fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        self.assertIsNone(cache.get_miss("Linkin Park", "Numb"))
+
+        cache._memory.clear()
+        manager = self.manager(miss(), cache_misses=True)
+        self.assertEqual(manager.fetch_lyrics("Linkin Park", "Numb", verbose=False).lyrics, "new")
+        self.assertEqual(manager._fetchers[0].calls, 0)
+
+
+class MissCacheTests(TempCacheTestCase):
+
+    def test_confirmed_miss_is_remembered(self):
+        manager = self.manager(miss(), miss(), cache_misses=True)
+        first = manager.fetch_lyrics("Nobody", "Nothing", verbose=False)
+        self.assertTrue(first.not_found)
+        second = manager.fetch_lyrics("Nobody", "Nothing", verbose=False)
+        self.assertFalse(second.success)
+        self.assertEqual([source.calls for source in manager._fetchers], [1, 1])
+
+    def test_failed_source_is_not_a_miss(self):
+        for failure in (miss(not_found=False), TimeoutError("timed out")):
+            with self.subTest(failure=failure):
+                manager = self.manager(miss(), failure, cache_misses=True)
+                result = manager.fetch_lyrics("Nobody", "Timeout", verbose=False)
+                self.assertFalse(result.not_found)
+                self.assertIsNone(cache.get_miss("Nobody", "Timeout"))
+
+    def test_misses_are_opt_in(self):
+        manager = self.manager(miss(), miss())
+        manager.fetch_lyrics("Nobody", "Nothing", verbose=False)
+        self.assertIsNone(cache.get_miss("Nobody", "Nothing"))
+
+    def test_miss_expires(self):
+        cache.put_miss("Nobody", "Nothing", miss())
+        self.assertIsNotNone(cache.get_miss("Nobody", "Nothing"))
+        with mock.patch.object(cache.time, "time", return_value=time.time() + cache.NEGATIVE_TTL + 1):
+            self.assertIsNone(cache.get_miss("Nobody", "Nothing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Offline tests for config loading and reloading.
+
+Config candidates are pointed at a temporary directory:
+
+    python tests/test_config.py
+"""
+
+import importlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# modules.config the attribute is the Config instance; fetch the submodule itself
+config_module = importlib.import_module("modules.config")
+from modules import utils
+
+
+class TempDirTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def write(self, name, data, mtime_ns=None):
+        """Write ``data`` as JSON, optionally forcing the modification time."""
+        path = self.dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+        if mtime_ns is not None:
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+        return str(path)
+
+
+class ConfigReloadTests(TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.candidates = (
+            str(self.dir / "skill" / "config.json"),
+            str(self.dir / "cwd" / "config.json"),
+        )
+        patcher = mock.patch.object(config_module, "_CANDIDATES", self.candidates)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.loads = mock.patch.object(config_module.json, "loads", wraps=json.loads).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def new_config(self):
+        # Config() is cached; build a separate instance from the wrapped class
+        return config_module.Config.__wrapped__()
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        self.write("cwd/config.json", {"proxy": {"enabled": True}})
+        config = self.new_config()
+        config.reload()
+        config.reload()
+        self.assertEqual(self.loads.call_count, 1)
+        self.assertTrue(config.proxy["enabled"])
+
+    def test_modified_file_is_reloaded(self):
+        path = self.write("cwd/config.json", {"translation": {"a": 1}}, mtime_ns=1_000_000_000)
+        config = self.new_config()
+        self.write("cwd/config.json", {"translation": {"a": 2}}, mtime_ns=1_000_000_001)
+        config.reload()
+        self.assertEqual(config.translation, {"a": 2})
+        self.assertEqual(config._config_path, path)
+
+    def test_higher_priority_file_created_later_is_used(self):
+        self.write("cwd/config.json", {"translation": {"from": "cwd"}})
+        config = self.new_config()
+        self.write("skill/config.json", {"translation": {"from": "skill"}})
+        config.reload()
+        self.assertEqual(config.translation, {"from": "skill"})
+        self.assertEqual(config._config_path, self.candidates[0])
+
+    def test_first_file_created_is_used(self):
+        config = self.new_config()
+        self.assertFalse(config.proxy["enabled"])
+        self.write("cwd/config.json", {"proxy": {"enabled": True}})
+        config.reload()
+        self.assertTrue(config.proxy["enabled"])
+
+
+class LoadConfigTests(TempDirTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(utils, "_CONFIG_CACHE", {})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_files_are_served_from_cache(self):
+        path = self.write("config.json", {"proxy": {"enabled": True}})
+        with mock.patch.object(utils.json, "load", wraps=json.load) as load:
+            first = utils.load_config([path])
+            second = utils.load_config([path])
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_changed_file_is_parsed_again(self):
+        path = self.write("config.json", {"translation": {"a": 1}}, mtime_ns=1_000_000_000)
+        utils.load_config([path])
+        self.write("config.json", {"translation": {"a": 2}}, mtime_ns=1_000_000_001)
+        self.assertEqual(utils.load_config([path])["translation"], {"a": 2})
+
+    def test_callers_cannot_corrupt_the_cache(self):
+        path = self.write("config.json", {"proxy": {"enabled": True}})
+        first = utils.load_config([path])
+        first["proxy"]["enabled"] = False
+        first["extra"] = 1
+        self.assertEqual(utils.load_config([path]), {"proxy": {"enabled": True}})
+
+        missing = [str(self.dir / "missing.json")]
+        utils.load_config(missing)["proxy"]["enabled"] = True
+        self.assertFalse(utils.load_config(missing)["proxy"]["enabled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Offline tests for batch mode of scripts/download_lyrics.py.
+
+Sources are replaced by a fake manager, so these run without network access:
+
+    python tests/test_download.py
+"""
+
+import contextlib
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.sources.base import LyricsResult
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "download_lyrics.py"
+spec = importlib.util.spec_from_file_location("download_lyrics", SCRIPT)
+download_lyrics = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(download_lyrics)
+
+
+class FakeManager:
+    """Answers fetch_many from a dict of song -> lyrics."""
+
+    def __init__(self, lyrics):
+        self.lyrics = lyrics
+        self.requested = None
+
+    def fetch_many(self, songs):
+        self.requested = list(songs)
+        return [
+            LyricsResult(success=True, lyrics=self.lyrics[song], source="Fake")
+            if song in self.lyrics else
+            LyricsResult(success=False, error="Lyrics not found", not_found=True)
+            for _, song in songs
+        ]
+
+
+class BatchTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dir = Path(self._tmp.name)
+
+    def write_csv(self, text, encoding="utf-8"):
+        path = self.dir / "songs.csv"
+        path.write_text(text, encoding=encoding)
+        return path
+
+    def run_batch(self, manager, csv_path):
+        """Run download_batch, returning (exit code or None, printed output)."""
+        out = io.StringIO()
+        code = None
+        with contextlib.redirect_stdout(out):
+            try:
+                download_lyrics.download_batch(manager, csv_path, self.dir / "lyrics")
+            except SystemExit as e:
+                code = e.code
+        return code, out.getvalue()
+
+
+class ReadSongListTests(BatchTestCase):
+
+    def test_rows_are_stripped_and_incomplete_rows_skipped(self):
+        path = self.write_csv(
+            "Linkin Park, Numb\n"
+            "\n"
+            "Only Artist\n"
+            ",No Artist\n"
+            '"Simon & Garfunkel","The Sound of Silence",1964\n'
+        )
+        self.assertEqual(download_lyrics.read_song_list(path), [
+            ("Linkin Park", "Numb"),
+            ("Simon & Garfunkel", "The Sound of Silence"),
+        ])
+
+    def test_header_row_is_skipped(self):
+        for header in ("artist,song", "Artist,Song", "ARTIST, Title"):
+            with self.subTest(header=header):
+                path = self.write_csv(f"{header}\nLinkin Park,Numb\n")
+                self.assertEqual(download_lyrics.read_song_list(path), [("Linkin Park", "Numb")])
+
+    def test_byte_order_mark_is_ignored(self):
+        path = self.write_csv("artist,song\nLinkin Park,Numb\n", encoding="utf-8-sig")
+        self.assertEqual(download_lyrics.read_song_list(path), [("Linkin Park", "Numb")])
+
+
+class DownloadBatchTests(BatchTestCase):
+
+    def test_saves_found_lyrics_and_exits_on_misses(self):
+        path = self.write_csv("artist,song\nLinkin Park,Numb\nNobody,Nothing\n")
+        manager = FakeManager({"Numb": "I'm tired of being what you want me to be"})
+        code, output = self.run_batch(manager, path)
+        self.assertEqual(manager.requested, [("Linkin Park", "Numb"), ("Nobody", "Nothing")])
+        self.assertEqual(code, 1)
+        self.assertIn("Saved 1/2", output)
+        self.assertEqual(len(list((self.dir / "lyrics").iterdir())), 1)
+
+    def test_all_found_exits_normally(self):
+        path = self.write_csv("Linkin Park,Numb\n")
+        code, _ = self.run_batch(FakeManager({"Numb": "la la"}), path)
+        self.assertIsNone(code)
+
+    def test_unreadable_file_is_a_usage_error(self):
+        missing = self.dir / "missing.csv"
+        not_utf8 = self.write_csv("Beyonc\xe9,Halo\n", encoding="latin-1")
+        for path in (missing, self.dir, not_utf8):
+            with self.subTest(path=path.name):
+                manager = FakeManager({})
+                code, output = self.run_batch(manager, path)
+                self.assertEqual(code, 1)
+                self.assertIn("Could not read song list", output)
+                self.assertIsNone(manager.requested)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,7 +72,8 @@ def test_manager():
     print(" Testing LyricsSourceManager")
     print("============================================================")
     
-    manager = LyricsSourceManager()
+    # Bypass the lyrics cache so this really exercises the sources
+    manager = LyricsSourceManager(use_cache=False)
     print(f"  Available sources: {', '.join(manager.sources)}")
     
     try:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Offline tests for the lazy exports of the ``modules`` package.
+
+Each check runs in a fresh interpreter so earlier imports don't leak in:
+
+    python tests/test_package.py
+"""
+
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def run(code: str) -> str:
+    """Run ``code`` in a new interpreter from the repo root and return its stdout."""
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return completed.stdout.strip()
+
+
+class LazyExportTests(unittest.TestCase):
+
+    def test_import_does_not_load_translators_or_proxy(self):
+        loaded = run(
+            "import sys, modules\n"
+            "print(sorted(m for m in ('modules.translators', 'modules.proxy') if m in sys.modules))"
+        )
+        self.assertEqual(loaded, "[]")
+
+    def test_first_access_imports_submodule(self):
+        output = run(
+            "import sys, modules\n"
+            "before = 'modules.translators' in sys.modules\n"
+            "manager_class = modules.TranslationManager\n"
+            "from modules.translators import TranslationManager\n"
+            "print(before, manager_class is TranslationManager, 'TranslationManager' in vars(modules))"
+        )
+        self.assertEqual(output, "False True True")
+
+    def test_config_is_the_shared_instance(self):
+        output = run(
+            "import modules\n"
+            "from modules.config import config\n"
+            "print(modules.config is config)"
+        )
+        self.assertEqual(output, "True")
+
+    def test_all_names_resolve(self):
+        output = run(
+            "import modules\n"
+            "print(all(hasattr(modules, name) for name in modules.__all__))"
+        )
+        self.assertEqual(output, "True")
+
+    def test_unknown_name_raises(self):
+        import modules
+        with self.assertRaises(AttributeError):
+            modules.NoSuchThing
+
+
+if __name__ == "__main__":
+    unittest.main()
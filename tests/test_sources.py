@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Offline tests for the lyrics sources and their HTML helpers.
+
+Pages come from tests/fixtures and HTTP calls are replaced, so these run
+without network access:
+
+    python tests/test_sources.py
+"""
+
+import io
+import sys
+import threading
+import time
+import unittest
+import urllib.error
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.sources import AZLyricsFetcher, GeniusFetcher, LetrasFetcher, YouTubeFetcher
+from modules.sources.azlyrics import _between_comments
+from modules.sources.base import LyricsResult, find_closing_div, first_in_order, read_until, slugify
+from modules.sources.genius import _container_bodies, _DATA_CONTAINER_RE
+from modules.sources.manager import MAX_CONCURRENT_FETCHES, LyricsSourceManager
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+class FakeResponse(io.BytesIO):
+    """In-memory stand-in for the object ``_make_request`` returns."""
+
+
+def serve(fetcher, pages):
+    """Make ``fetcher`` answer requests from ``pages`` (url -> bytes or exception)."""
+    requested = []
+
+    def make_request(url, headers=None, timeout=30):
+        requested.append(url)
+        page = pages(url) if callable(pages) else pages
+        if isinstance(page, Exception):
+            raise page
+        return FakeResponse(page)
+
+    fetcher._make_request = make_request
+    return requested
+
+
+def http_404(url):
+    return urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+
+
+class NotFoundTests(unittest.TestCase):
+
+    def test_letras_url_and_not_found(self):
+        fetcher = LetrasFetcher()
+        requested = serve(fetcher, http_404)
+        result = fetcher.fetch("Beyond Awareness", "Crime")
+        self.assertEqual(requested, ["https://www.letras.com/beyond-awareness/crime/"])
+        self.assertFalse(result.success)
+        self.assertTrue(result.not_found)
+
+    def test_connection_error_is_not_a_miss(self):
+        fetcher = LetrasFetcher()
+        serve(fetcher, urllib.error.URLError("connection refused"))
+        result = fetcher.fetch("Beyond Awareness", "Crime")
+        self.assertFalse(result.success)
+        self.assertFalse(result.not_found)
+
+
+class GeniusContainerTests(unittest.TestCase):
+
+    def test_find_closing_div_skips_nested_divs(self):
+        html = b'<div a><div b><div c></div></div>tail</div><div>next</div>'
+        end = find_closing_div(html, len(b'<div a>'))
+        self.assertEqual(html[end:end + 6], b'</div>')
+        self.assertEqual(html[end - 4:end], b'tail')
+
+    def test_find_closing_div_unclosed(self):
+        self.assertEqual(find_closing_div(b'<div><div>open</div>', 5), -1)
+
+    def test_find_closing_div_ignores_similar_tags(self):
+        html = b'<divider></divider>text</div>'
+        self.assertEqual(find_closing_div(html, 0), html.index(b'</div>', len(b'<divider></divider>')))
+
+    def test_genius_container_bodies(self):
+        page = load_fixture("genius_song.html")
+        bodies = _container_bodies(page, b'data-lyrics-container="true"', _DATA_CONTAINER_RE)
+        # The marker inside the <script> is not a container
+        self.assertEqual(len(bodies), 2)
+        self.assertIn(b"Don't know what you're expecting of me", bodies[0])
+        self.assertIn(b"Put under the pressure", bodies[0])
+        self.assertNotIn(b"Numb Lyrics", bodies[0])
+        self.assertNotIn(b"RightSidebar", bodies[0])
+
+    def test_genius_extract_lyrics(self):
+        fetcher = GeniusFetcher()
+        serve(fetcher, load_fixture("genius_song.html"))
+        result = fetcher._extract_lyrics("https://genius.com/Linkin-park-numb-lyrics")
+        self.assertTrue(result.success)
+        self.assertEqual(result.title, "Numb")
+        lines = result.lyrics.split('\n')
+        self.assertEqual(lines[0], "[Verse 1]")
+        self.assertIn("I'm tired of being what you want me to be", lines)
+        self.assertIn("Put under the pressure of walking in your shoes", lines)
+        self.assertIn("[Chorus]", lines)
+        self.assertNotIn("Footer", result.lyrics)
+
+
+class StreamingReadTests(unittest.TestCase):
+
+    def test_read_until_stops_after_last_marker(self):
+        body = b'head <!-- start -->' + b'x' * 100 + b'<!-- end -->' + b'y' * 10000
+        response = FakeResponse(body)
+        data = read_until(response, b'<!-- start -->', b'<!-- end -->', chunk_size=64)
+        self.assertIn(b'<!-- end -->', data)
+        self.assertLess(len(data), len(body))
+
+    def test_read_until_finds_marker_split_across_chunks(self):
+        body = b'a' * 30 + b'MARKER' + b'b' * 1000
+        data = read_until(FakeResponse(body), b'MARKER', chunk_size=32)
+        self.assertIn(b'MARKER', data)
+        self.assertLess(len(data), len(body))
+
+    def test_read_until_missing_marker_returns_whole_body(self):
+        body = b'z' * 5000
+        self.assertEqual(read_until(FakeResponse(body), b'never', chunk_size=1024), body)
+
+    def test_azlyrics_fetch(self):
+        fetcher = AZLyricsFetcher()
+        requested = serve(fetcher, load_fixture("azlyrics_song.html"))
+        result = fetcher.fetch("Linkin Park", "Numb")
+        self.assertEqual(requested, ["https://www.azlyrics.com/lyrics/linkinpark/numb.html"])
+        self.assertTrue(result.success)
+        self.assertIn("Feeling so faithless, lost under the surface", result.lyrics)
+        self.assertNotIn("<br>", result.lyrics)
+
+
+class DelimiterSliceTests(unittest.TestCase):
+
+    def test_azlyrics_between_comments(self):
+        body = _between_comments(load_fixture("azlyrics_song.html"))
+        self.assertIn(b"I'm tired of being what you want me to be", body)
+        self.assertNotIn(b"MxM banner", body)
+        self.assertIsNone(_between_comments(b'<html>no lyrics here</html>'))
+
+
+class SlugifyTests(unittest.TestCase):
+
+    def test_slugify(self):
+        self.assertEqual(slugify("AC/DC"), "acdc")
+        self.assertEqual(slugify("Beyond Awareness", '-'), "beyond-awareness")
+        self.assertEqual(slugify("  Don't Stop Me Now! ", '-'), "don-t-stop-me-now")
+        self.assertEqual(slugify("Beyoncé", '-'), "beyonc")
+
+
+class YouTubeDescriptionTests(unittest.TestCase):
+
+    def test_youtube_description(self):
+        fetcher = YouTubeFetcher()
+        serve(fetcher, load_fixture("youtube_watch.html"))
+        result = fetcher._try_video_description("kXYiU_JCYtU", {})
+        self.assertTrue(result.success)
+        self.assertTrue(result.lyrics.startswith("[Verse 1]"))
+        self.assertNotIn("Subscribe", result.lyrics)
+
+
+class TimedSource:
+    """Lyrics source that answers after ``latency`` seconds."""
+
+    def __init__(self, name, latency, found):
+        self.name = name
+        self.latency = latency
+        self.found = found
+        self.calls = 0
+
+    def fetch(self, artist, song, artist_slug=None, song_slug=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        if self.found:
+            return LyricsResult(success=True, lyrics=f"from {self.name}", source=self.name)
+        return LyricsResult(success=False, error="Lyrics not found", not_found=True)
+
+
+def sleepy(item):
+    """first_in_order worker: item is (name, latency, accepted); raises for latency None."""
+    name, latency, accepted = item
+    if latency is None:
+        raise RuntimeError(name)
+    time.sleep(latency)
+    return name, accepted
+
+
+def accepted(value):
+    return value[1]
+
+
+class PriorityTests(unittest.TestCase):
+
+    def test_earlier_success_wins_even_when_slower(self):
+        items = [("slow", 0.2, True), ("fast", 0.0, True)]
+        self.assertEqual(first_in_order(sleepy, items, accepted), ("slow", True))
+
+    def test_later_success_waits_for_earlier_misses(self):
+        items = [("slow miss", 0.1, False), ("error", None, False), ("hit", 0.0, True)]
+        self.assertEqual(first_in_order(sleepy, items, accepted), ("hit", True))
+
+    def test_nothing_accepted(self):
+        items = [("miss", 0.0, False), ("error", None, False)]
+        self.assertIsNone(first_in_order(sleepy, items, accepted))
+
+    def test_manager_prefers_higher_priority_fallback(self):
+        manager = LyricsSourceManager(use_cache=False)
+        manager._fetchers = [
+            TimedSource("Preferred", 0.0, found=False),
+            TimedSource("Slow", 0.2, found=True),
+            TimedSource("Fast", 0.0, found=True),
+        ]
+        result = manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        self.assertEqual(result.source, "Slow")
+
+
+class InFlightSource(TimedSource):
+    """TimedSource that records the peak number of concurrent fetches."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fetch(self, artist, song, artist_slug=None, song_slug=None):
+        cls = InFlightSource
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            return super().fetch(artist, song, artist_slug, song_slug)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+
+class StagedFanOutTests(unittest.TestCase):
+
+    def test_abandoned_items_are_not_waited_for(self):
+        items = [("hit", 0.0, True), ("slow", 2.0, True)]
+        started = time.monotonic()
+        self.assertEqual(first_in_order(sleepy, items, accepted), ("hit", True))
+        self.assertLess(time.monotonic() - started, 1.0)
+
+    def test_preferred_hit_skips_fallbacks(self):
+        manager = LyricsSourceManager(use_cache=False)
+        manager._fetchers = [TimedSource("Preferred", 0.0, found=True), TimedSource("Other", 0.0, found=True)]
+        result = manager.fetch_lyrics("Linkin Park", "Numb", verbose=False)
+        self.assertEqual(result.source, "Preferred")
+        self.assertEqual(manager._fetchers[1].calls, 0)
+
+    def test_fetch_many_bounds_concurrent_fetches(self):
+        InFlightSource.in_flight = InFlightSource.peak = 0
+        manager = LyricsSourceManager(use_cache=False)
+        manager._fetchers = [InFlightSource(f"Source{i}", 0.02, found=False) for i in range(5)]
+        songs = [("Artist", f"Song {i}") for i in range(10)]
+        results = manager.fetch_many(songs, max_workers=10)
+        self.assertEqual(len(results), len(songs))
+        self.assertGreater(InFlightSource.peak, 1)
+        self.assertLessEqual(InFlightSource.peak, MAX_CONCURRENT_FETCHES)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Offline tests for translation batching.
+
+HTTP calls and deep_translator are replaced by fakes, so these run without
+network access:
+
+    python tests/test_translators.py
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.translators import TranslationManager, google
+from modules.translators.base import BaseTranslator
+from modules.translators.baidu import BaiduTranslator, _MAX_QUERY_BYTES
+
+
+class BaiduChunkingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.translator = BaiduTranslator("appid", "secret")
+        self.requests = []
+
+    def fake_request(self, text, source, target):
+        self.requests.append(text)
+        return [f"<{line}>" for line in text.split('\n')]
+
+    def test_chunks_stay_under_query_limit(self):
+        lines = [f"line {i} " + "x" * 90 for i in range(200)]
+        with mock.patch.object(self.translator, "_request", self.fake_request):
+            translated = self.translator.translate_lines(lines)
+        self.assertEqual(translated, [f"<{line}>" for line in lines])
+        self.assertGreater(len(self.requests), 1)
+        for text in self.requests:
+            self.assertLessEqual(len(text.encode()), _MAX_QUERY_BYTES)
+
+    def test_mismatched_reply_falls_back_to_single_lines(self):
+        lines = ["first", "second", "third"]
+
+        def merging_request(text, source, target):
+            self.requests.append(text)
+            if '\n' in text:
+                return ["first second", "third"]
+            return [f"<{text}>"]
+
+        with mock.patch.object(self.translator, "_request", merging_request):
+            translated = self.translator.translate_lines(lines)
+        self.assertEqual(translated, ["<first>", "<second>", "<third>"])
+        self.assertEqual(self.requests, ["first\nsecond\nthird", "first", "second", "third"])
+
+    def test_requests_are_spaced_by_delay(self):
+        delay = 0.05
+        starts = []
+
+        def merging_request(text, source, target):
+            starts.append(time.monotonic())
+            # Two chunks; the first reply merges lines, forcing per-line calls
+            if '\n' in text and text.startswith("a"):
+                return ["merged"]
+            return [f"<{line}>" for line in text.split('\n')]
+
+        lines = ["a" * 3000, "a" * 1500, "b" * 3000]
+        with mock.patch.object(self.translator, "_request", merging_request):
+            translated = self.translator.translate_lines(lines, delay=delay)
+        self.assertEqual(translated, [f"<{line}>" for line in lines])
+        # Merged chunk, its two per-line fallbacks, then the second chunk
+        self.assertEqual(len(starts), 4)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        self.assertGreaterEqual(min(gaps), delay * 0.9)
+
+
+class FakeDeepTranslator:
+    """Stands in for deep_translator.GoogleTranslator."""
+
+    requests = []
+    starts = []
+    merge_lines = False
+
+    def __init__(self, source='auto', target='zh-CN', proxies=None):
+        pass
+
+    def translate(self, text):
+        FakeDeepTranslator.requests.append(text)
+        FakeDeepTranslator.starts.append(time.monotonic())
+        lines = [f"<{line}>" for line in text.split('\n')]
+        if self.merge_lines and len(lines) > 1:
+            lines = [' '.join(lines)]
+        return '\n'.join(lines)
+
+
+class GoogleBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        FakeDeepTranslator.requests = []
+        FakeDeepTranslator.starts = []
+        FakeDeepTranslator.merge_lines = False
+        self.translator = google.GoogleTranslator()
+        self.translator._translator_class = FakeDeepTranslator
+        self.translator._translator = FakeDeepTranslator()
+        self.translator._init_attempted = True
+
+    def test_chunk_lines_respects_limits(self):
+        lines = [f"line {i}" for i in range(45)]
+        chunks = self.translator._chunk_lines(lines)
+        self.assertEqual([len(chunk) for chunk in chunks], [google.BATCH_LINES, google.BATCH_LINES, 5])
+
+        long_lines = ["y" * 1000] * 10
+        for chunk in self.translator._chunk_lines(long_lines):
+            self.assertLessEqual(len('\n'.join(chunk)), google.BATCH_CHARS)
+
+    def test_batch_packs_lines_and_skips_markers(self):
+        texts = ["[Chorus]", "hello", "", "world", "hello"]
+        results = self.translator.translate_batch(texts, delay=0)
+        self.assertEqual(results, {"[Chorus]": "[Chorus]", "hello": "<hello>", "": "", "world": "<world>"})
+        self.assertEqual(FakeDeepTranslator.requests, ["hello\nworld"])
+
+    def test_batch_mismatch_falls_back_to_single_lines(self):
+        FakeDeepTranslator.merge_lines = True
+        results = self.translator.translate_batch(["one", "two"], delay=0)
+        self.assertEqual(results, {"one": "<one>", "two": "<two>"})
+        self.assertEqual(FakeDeepTranslator.requests, ["one\ntwo", "one", "two"])
+
+    def test_batch_request_starts_are_spaced_by_delay(self):
+        delay = 0.05
+        texts = [f"line {i}" for i in range(google.BATCH_LINES * 4)]
+        results = self.translator.translate_batch(texts, delay=delay, concurrency=4)
+        self.assertEqual(results, {text: f"<{text}>" for text in texts})
+        starts = sorted(FakeDeepTranslator.starts)
+        self.assertEqual(len(starts), 4)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        self.assertGreaterEqual(min(gaps), delay * 0.9)
+
+
+class SlowTranslator(BaseTranslator):
+    """Line-by-line API translator that records when each request starts."""
+
+    name = "Slow"
+    is_available = True
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def translate(self, text, source='auto', target='zh'):
+        with self._lock:
+            self.starts.append(time.monotonic())
+        time.sleep(self.latency)
+        return f"<{text}>"
+
+
+class ConcurrentPacingTests(unittest.TestCase):
+
+    def test_request_starts_are_spaced_by_delay(self):
+        delay = 0.05
+        translator = SlowTranslator(latency=0.2)
+        manager = TranslationManager()
+        manager.translators = [translator]
+
+        texts = [f"line {i}" for i in range(6)]
+        results = manager.translate_batch(texts, delay=delay)
+
+        self.assertEqual(results, {text: f"<{text}>" for text in texts})
+        starts = sorted(translator.starts)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        # Small allowance for timer granularity
+        self.assertGreaterEqual(min(gaps), delay * 0.9)
+        # Requests still overlap: the whole batch beats a serial loop
+        self.assertLess(starts[-1] - starts[0] + translator.latency,
+                        len(texts) * (translator.latency + delay))
+
+
+class TranslationCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.translator = SlowTranslator(latency=0)
+        self.manager = TranslationManager()
+        self.manager.translators = [self.translator]
+
+    def test_repeated_text_is_translated_once(self):
+        self.assertEqual(self.manager.translate("hello"), "<hello>")
+        self.assertEqual(self.manager.translate("hello"), "<hello>")
+        self.assertEqual(len(self.translator.starts), 1)
+
+    def test_key_includes_languages(self):
+        self.manager.translate("hello", target='zh')
+        self.manager.translate("hello", target='ja')
+        self.manager.translate("hello", source='en', target='zh')
+        self.assertEqual(len(self.translator.starts), 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        with mock.patch("modules.translators.manager.CACHE_SIZE", 2):
+            self.manager.translate("one")
+            self.manager.translate("two")
+            self.manager.translate("one")  # now "two" is the oldest
+            self.manager.translate("three")
+            self.assertEqual(len(self.translator.starts), 3)
+
+            self.manager.translate("one")
+            self.assertEqual(len(self.translator.starts), 3)
+            self.manager.translate("two")
+            self.assertEqual(len(self.translator.starts), 4)
+
+    def test_batch_sends_only_uncached_lines(self):
+        first = self.manager.translate_batch(["hello", "world", "hello", ""], delay=0)
+        self.assertEqual(first, {"hello": "<hello>", "world": "<world>", "": ""})
+        self.assertEqual(len(self.translator.starts), 2)
+
+        second = self.manager.translate_batch(["world", "hello"], delay=0)
+        self.assertEqual(second, {"world": "<world>", "hello": "<hello>"})
+        self.assertEqual(len(self.translator.starts), 2)
+
+        self.manager.translate_batch(["hello", "again"], delay=0)
+        self.assertEqual(len(self.translator.starts), 3)
+
+    def test_clear_cache(self):
+        self.manager.translate_batch(["hello"], delay=0)
+        self.manager.clear_cache()
+        self.manager.translate_batch(["hello"], delay=0)
+        self.assertEqual(len(self.translator.starts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()